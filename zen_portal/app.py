@@ -6,7 +6,7 @@ Main Textual application.
 import os
 import shutil
 import sys
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from textual.app import App
@@ -16,11 +16,12 @@ from zen_portal.screens.main import MainScreen
 from zen_portal.services.tmux import TmuxService
 from zen_portal.services.session_manager import SessionManager
 from zen_portal.services.session_state import SessionStateService
-from zen_portal.services.config import ConfigManager
+from zen_portal.services.config import ConfigManager, FeatureSettings, ZenAIConfig
 from zen_portal.services.worktree import WorktreeService
 from zen_portal.services.profile import ProfileManager
 from zen_portal.services.notification import NotificationService
 from zen_portal.services.discovery import DiscoveryService
+from zen_portal.services.zen_ai import ZenAI
 from zen_portal.styles import BASE_CSS
 
 
@@ -36,6 +37,9 @@ class Services:
     state: SessionStateService
     worktree: WorktreeService | None
     discovery: DiscoveryService
+    # Built on first use and refreshed whenever the resolved config changes
+    _zen_ai: ZenAI | None = field(default=None, init=False, repr=False)
+    _zen_ai_for: FeatureSettings | None = field(default=None, init=False, repr=False)
 
     @classmethod
     def create(cls, working_dir: Path | None = None) -> "Services":
@@ -83,6 +87,22 @@ class Services:
             discovery=discovery,
         )
 
+    @property
+    def zen_ai(self) -> ZenAI:
+        """Shared Zen AI service, kept in sync with the saved config.
+
+        One instance holds no per-query state, so it is reused; its config and
+        proxy settings are swapped in only when resolve_features() changes.
+        """
+        resolved = self.config.resolve_features()
+        if self._zen_ai is None:
+            self._zen_ai = ZenAI(resolved.zen_ai or ZenAIConfig(), resolved.openrouter_proxy)
+        elif resolved is not self._zen_ai_for:
+            self._zen_ai.config = resolved.zen_ai or ZenAIConfig()
+            self._zen_ai.proxy_settings = resolved.openrouter_proxy
+        self._zen_ai_for = resolved
+        return self._zen_ai
+
 
 def _clear_pycache() -> None:
     """Clear Python bytecode cache to ensure fresh code on restart."""
@@ -219,6 +239,11 @@ class ZenPortalApp(App):
         """Access notification service."""
         return self.services.notification
 
+    @property
+    def zen_ai(self) -> ZenAI:
+        """Access the shared Zen AI service."""
+        return self.services.zen_ai
+
 
 def main():
     """Run the Zen Portal application."""
@@ -1,5 +1,7 @@
 """ConfigScreen: Settings configuration with keyboard navigation."""
 
+from dataclasses import replace
+
 from textual.app import ComposeResult
 from textual.binding import Binding
 from textual.screen import ModalScreen
@@ -265,11 +267,14 @@ class ConfigScreen(ModalScreen[None]):
         default_system_prompt = system_prompt_input.value.strip() or None
 
         config = self._config_manager.config
-        config.defaults.working_dir = global_path
-        config.defaults.enabled_session_types = enabled_types_to_save
-        config.defaults.zen_ai = zen_ai_config
-        config.defaults.default_prompt = default_prompt
-        config.defaults.default_system_prompt = default_system_prompt
+        config = replace(config, defaults=replace(
+            config.defaults,
+            working_dir=global_path,
+            enabled_session_types=enabled_types_to_save,
+            zen_ai=zen_ai_config,
+            default_prompt=default_prompt,
+            default_system_prompt=default_system_prompt,
+        ))
         self._config_manager.save_config(config)
 
         # Save instance directory (now as project setting)
@@ -279,7 +284,7 @@ class ConfigScreen(ModalScreen[None]):
             features = FeatureSettings(working_dir=instance_path)
             self._config_manager.update_project_features(features)
         else:
-            config.project.working_dir = None
+            config = replace(config, project=replace(config.project, working_dir=None))
             self._config_manager.save_config(config)
 
         # Save theme to profile
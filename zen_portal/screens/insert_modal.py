@@ -175,8 +175,9 @@ class InsertModal(ModalScreen[InsertResult | None]):
             return
 
         # Check for special keys (arrows, function keys, modifiers)
-        if key in SPECIAL_KEYS:
-            tmux_key, display = SPECIAL_KEYS[key]
+        special = SPECIAL_KEYS.get(key)
+        if special is not None:
+            tmux_key, display = special
             self._add_special(tmux_key, display)
             event.prevent_default()
             event.stop()
@@ -1,6 +1,7 @@
 """Billing configuration widget for NewSessionModal."""
 
 import os
+from dataclasses import replace
 
 from textual.app import ComposeResult
 from textual.containers import Vertical
@@ -232,12 +233,16 @@ class BillingWidget(Static):
                     default_model=self.get_model(),
                 )
                 config = self._config.config
-                config.defaults.openrouter_proxy = proxy_settings
+                config = replace(config, defaults=replace(config.defaults, openrouter_proxy=proxy_settings))
                 self._config.save_config(config)
             else:
                 config = self._config.config
-                if config.defaults.openrouter_proxy:
-                    config.defaults.openrouter_proxy.enabled = False
+                proxy = config.defaults.openrouter_proxy
+                if proxy:
+                    config = replace(
+                        config,
+                        defaults=replace(config.defaults, openrouter_proxy=replace(proxy, enabled=False)),
+                    )
                     self._config.save_config(config)
         except Exception:
             pass  # Non-critical - continue with session creation
@@ -1,5 +1,6 @@
 """NewSessionModal: Create, attach, or resume sessions."""
 
+import os
 import re
 from pathlib import Path
 
@@ -29,6 +30,46 @@ _FILE_REF_PATTERN = re.compile(r'^@(.+)$')
 _MAX_PROMPT_FILE_SIZE = 1024 * 1024
 
 
+# Recently read prompt files: path -> (mtime_ns, size, text). Keyed on path
+# alone so an edited file replaces its entry instead of adding one; files
+# above _PROMPT_CACHE_MAX_FILE_SIZE are read fresh and never held.
+_PROMPT_CACHE: dict[str, tuple[int, int, str]] = {}
+_PROMPT_CACHE_MAX_ENTRIES = 32
+_PROMPT_CACHE_MAX_FILE_SIZE = 64 * 1024
+
+
+def _read_prompt_file(path: str, mtime_ns: int, size: int) -> str:
+    """Read a prompt file as stripped UTF-8 text.
+
+    A cached entry is reused only while the file's mtime_ns and size match
+    the caller's stat; size also bounds the single read. Read errors raise
+    and are never cached.
+    """
+    cached = _PROMPT_CACHE.get(path)
+    if cached is not None and cached[0] == mtime_ns and cached[1] == size:
+        return cached[2]
+
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        raw = os.read(fd, size)
+    finally:
+        os.close(fd)
+    # Most prompt files are plain ASCII, which has the cheapest decode
+    text = raw.decode("ascii") if raw.isascii() else raw.decode("utf-8")
+    if "\r" in text:
+        # Match read_text's universal newline handling
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    text = text.strip()
+
+    _PROMPT_CACHE.pop(path, None)
+    if size <= _PROMPT_CACHE_MAX_FILE_SIZE:
+        if len(_PROMPT_CACHE) >= _PROMPT_CACHE_MAX_ENTRIES:
+            # Evict the oldest entry (dicts keep insertion order)
+            del _PROMPT_CACHE[next(iter(_PROMPT_CACHE))]
+        _PROMPT_CACHE[path] = (mtime_ns, size, text)
+    return text
+
+
 def expand_file_reference(text: str, working_dir: Path | None = None) -> tuple[str, str | None]:
     """Expand @filepath references to file contents.
 
@@ -48,6 +89,9 @@ def expand_file_reference(text: str, working_dir: Path | None = None) -> tuple[s
         return text, None
 
     text = text.strip()
+    # Most prompts are plain text: skip the regex unless it can match
+    if not text.startswith("@"):
+        return text, None
     match = _FILE_REF_PATTERN.match(text)
     if not match:
         return text, None
@@ -72,15 +116,15 @@ def expand_file_reference(text: str, working_dir: Path | None = None) -> tuple[s
 
     # Check file size
     try:
-        size = file_path.stat().st_size
-        if size > _MAX_PROMPT_FILE_SIZE:
-            return text, f"file too large: {size // 1024}KB (max 1MB)"
+        st = file_path.stat()
+        if st.st_size > _MAX_PROMPT_FILE_SIZE:
+            return text, f"file too large: {st.st_size // 1024}KB (max 1MB)"
     except OSError as e:
         return text, f"cannot stat file: {e}"
 
     # Read with explicit encoding
     try:
-        content = file_path.read_text(encoding="utf-8").strip()
+        content = _read_prompt_file(str(file_path), st.st_mtime_ns, st.st_size)
         return content, None
     except UnicodeDecodeError:
         return text, f"file not UTF-8: {file_path.name}"
@@ -1,22 +1,30 @@
-"""Services for Zen Portal."""
+"""Services for Zen Portal.
 
-from zen_portal.services.tmux import TmuxService, TmuxResult
-from zen_portal.services.session_manager import (
-    SessionManager,
-    SessionLimitError,
-)
-from zen_portal.services.validation import (
-    validate_prompt,
-    validate_session_name,
-    ValidationError,
-)
+Re-exports are resolved lazily so importing a single service module
+(e.g. zen_portal.services.config) doesn't pull in the session manager
+and its Textual dependencies.
+"""
 
-__all__ = [
-    "TmuxService",
-    "TmuxResult",
-    "SessionManager",
-    "SessionLimitError",
-    "validate_prompt",
-    "validate_session_name",
-    "ValidationError",
-]
+from importlib import import_module
+
+# Public name -> defining module
+_EXPORTS = {
+    "TmuxService": "zen_portal.services.tmux",
+    "TmuxResult": "zen_portal.services.tmux",
+    "SessionManager": "zen_portal.services.session_manager",
+    "SessionLimitError": "zen_portal.services.session_manager",
+    "validate_prompt": "zen_portal.services.validation",
+    "validate_session_name": "zen_portal.services.validation",
+    "ValidationError": "zen_portal.services.validation",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
@@ -17,7 +17,8 @@ import json
 import logging
 import os
 import stat
-from dataclasses import dataclass, field
+from dataclasses import dataclass, replace
+from typing import ClassVar
 from pathlib import Path
 from enum import Enum
 
@@ -25,28 +26,31 @@ from enum import Enum
 logger = logging.getLogger(__name__)
 
 
+# Buffer size for config file I/O; config files fit in a single read/write
+_IO_BUFFER_SIZE = 65536
+
+
 def _secure_write_json(path: Path, data: dict) -> None:
     """Write JSON to file with restricted permissions (0600).
 
     This ensures config files containing potential secrets
     are only readable by the owner.
     """
-    content = json.dumps(data, indent=2)
+    content = json.dumps(data, indent=2).encode("utf-8")
     # Write to temp file first, then rename for atomicity
     temp_path = path.with_suffix(".tmp")
     try:
         # Create with restricted permissions from the start
         fd = os.open(str(temp_path), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
-        try:
-            os.write(fd, content.encode())
-        finally:
-            os.close(fd)
-        # Atomic rename
-        temp_path.rename(path)
+        # Buffered writer issues one write syscall and retries short writes
+        with os.fdopen(fd, "wb", buffering=_IO_BUFFER_SIZE) as f:
+            f.write(content)
+        # Atomic rename (replaces an existing file on every platform)
+        os.replace(temp_path, path)
     except Exception as e:
         # Fallback: write normally then chmod
         logger.warning(f"Failed to create temp file with restricted permissions: {e}")
-        path.write_text(content)
+        path.write_bytes(content)
         try:
             path.chmod(stat.S_IRUSR | stat.S_IWUSR)  # 0600
         except OSError as e:
@@ -73,6 +77,11 @@ class ClaudeModel(Enum):
     HAIKU = "haiku"
 
 
+# Value -> member lookups for deserialization
+_MODEL_BY_VALUE = {m.value: m for m in ClaudeModel}
+_EXIT_BY_VALUE = {e.value: e for e in ExitBehavior}
+
+
 # All available session types for configuration
 ALL_SESSION_TYPES = ["ai", "shell"]
 
@@ -178,6 +187,8 @@ class ZenAIConfig:
     provider: ZenAIProvider = ZenAIProvider.CLAUDE
     # Custom OpenRouter model (overrides model enum)
     openrouter_model: str = ""
+    # Seconds between streamed chunks (0 = yield without delay)
+    stream_delay: float = 0.0
 
     def to_dict(self) -> dict:
         result: dict = {"enabled": self.enabled}
@@ -187,6 +198,8 @@ class ZenAIConfig:
             result["provider"] = self.provider.value
         if self.openrouter_model:
             result["openrouter_model"] = self.openrouter_model
+        if self.stream_delay > 0:
+            result["stream_delay"] = self.stream_delay
         return result
 
     @classmethod
@@ -205,11 +218,19 @@ class ZenAIConfig:
             except ValueError:
                 pass
 
+        stream_delay = 0.0
+        if data.get("stream_delay"):
+            try:
+                stream_delay = float(data["stream_delay"])
+            except (TypeError, ValueError):
+                pass
+
         return cls(
             enabled=data.get("enabled", False),
             model=model,
             provider=provider,
             openrouter_model=data.get("openrouter_model", ""),
+            stream_delay=stream_delay,
         )
 
     @property
@@ -282,7 +303,7 @@ class WorktreeSettings:
         )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FeatureSettings:
     """Settings that can be overridden at any tier.
 
@@ -306,6 +327,9 @@ class FeatureSettings:
     default_prompt: str | None = None  # Initial prompt for AI sessions
     default_system_prompt: str | None = None  # System prompt for Claude sessions
 
+    # Shared all-None instance (assigned below the class)
+    EMPTY: ClassVar["FeatureSettings"]
+
     def to_dict(self) -> dict:
         result = {}
         if self.working_dir is not None:
@@ -333,7 +357,7 @@ class FeatureSettings:
     @classmethod
     def from_dict(cls, data: dict) -> "FeatureSettings":
         working_dir = Path(data["working_dir"]) if data.get("working_dir") else None
-        model = ClaudeModel(data["model"]) if data.get("model") else None
+        model = _MODEL_BY_VALUE.get(data["model"]) if data.get("model") else None
         worktree = WorktreeSettings.from_dict(data["worktree"]) if data.get("worktree") else None
         enabled_types = data.get("enabled_session_types")
         openrouter_proxy = ProxySettings.from_dict(data["openrouter_proxy"]) if data.get("openrouter_proxy") else None
@@ -353,6 +377,10 @@ class FeatureSettings:
 
     def merge_with(self, override: "FeatureSettings") -> "FeatureSettings":
         """Return new settings with override values taking precedence."""
+        # Nothing to override (the common case for unset project settings)
+        if override is FeatureSettings.EMPTY or override == FeatureSettings.EMPTY:
+            return self
+
         # Merge worktree settings if both exist
         merged_worktree = self.worktree
         if override.worktree is not None:
@@ -386,17 +414,21 @@ class FeatureSettings:
         )
 
 
-@dataclass
+FeatureSettings.EMPTY = FeatureSettings()
+
+
+@dataclass(slots=True, frozen=True)
 class Config:
     """Unified Zen Portal configuration.
 
     Stored in ~/.config/zen-portal/config.json
     Contains both global defaults and current project settings.
+    Immutable; use dataclasses.replace() and save_config() to change it.
     """
 
     exit_behavior: ExitBehavior = ExitBehavior.ASK
-    defaults: FeatureSettings = field(default_factory=FeatureSettings)
-    project: FeatureSettings = field(default_factory=FeatureSettings)
+    defaults: FeatureSettings = FeatureSettings.EMPTY
+    project: FeatureSettings = FeatureSettings.EMPTY
     project_description: str = ""  # Optional description of current project
 
     def to_dict(self) -> dict:
@@ -417,13 +449,18 @@ class Config:
         defaults = FeatureSettings.from_dict(data.get("defaults", {}) or data.get("features", {}))
         project = FeatureSettings.from_dict(data.get("project", {}))
         return cls(
-            exit_behavior=ExitBehavior(data.get("exit_behavior", "ask")),
+            exit_behavior=_EXIT_BY_VALUE.get(data.get("exit_behavior"), ExitBehavior.ASK),
             defaults=defaults,
             project=project,
             project_description=data.get("project_description", ""),
         )
 
 
+# Loaded configs shared by every ConfigManager in the process, keyed by
+# config file. Disk is read once per file; saves keep the entry current.
+_CONFIG_CACHE: dict[Path, Config] = {}
+
+
 class ConfigManager:
     """Manages unified configuration with defaults and project settings."""
 
@@ -435,20 +472,36 @@ class ConfigManager:
         self._config_dir = config_dir
         self._config_file = config_dir / "config.json"
         self._config: Config | None = None
+        # Memoized resolve_features() result and the Config it came from.
+        # Config and FeatureSettings are frozen, but nested ProxySettings,
+        # WorktreeSettings and ZenAIConfig are not; save_config() always
+        # drops the memo so an in-place edit that is saved is still seen.
+        self._resolved_for: Config | None = None
+        self._resolved: FeatureSettings | None = None
+
+    @classmethod
+    def _invalidate(cls, config_dir: Path) -> None:
+        """Drop the cached config so the next manager re-reads it from disk."""
+        _CONFIG_CACHE.pop(config_dir / "config.json", None)
 
     @property
     def config(self) -> Config:
         if self._config is None:
-            self._config = self._load_config()
+            cached = _CONFIG_CACHE.get(self._config_file)
+            if cached is None:
+                cached = _CONFIG_CACHE[self._config_file] = self._load_config()
+            self._config = cached
         return self._config
 
     def _load_config(self) -> Config:
         """Load config from disk."""
         if self._config_file.exists():
             try:
-                data = json.loads(self._config_file.read_text())
+                # json parses bytes directly; skip the text-mode decode layer
+                with open(self._config_file, "rb", buffering=_IO_BUFFER_SIZE) as f:
+                    data = json.loads(f.read())
                 return Config.from_dict(data)
-            except (json.JSONDecodeError, KeyError, ValueError):
+            except (json.JSONDecodeError, KeyError, ValueError, TypeError):
                 pass
         return Config()
 
@@ -456,28 +509,29 @@ class ConfigManager:
         """Save config to disk with secure permissions."""
         self._config_dir.mkdir(parents=True, exist_ok=True)
         _secure_write_json(self._config_file, config.to_dict())
-        self._config = config
+        self._config = _CONFIG_CACHE[self._config_file] = config
+        self._resolved_for = self._resolved = None
 
     def update_exit_behavior(self, behavior: ExitBehavior) -> None:
         """Update exit behavior setting."""
-        config = self.config
-        config.exit_behavior = behavior
-        self.save_config(config)
+        self.save_config(replace(self.config, exit_behavior=behavior))
 
     def update_project_features(self, features: FeatureSettings, description: str = "") -> None:
         """Update project-level feature overrides."""
         config = self.config
-        config.project = features
-        if description:
-            config.project_description = description
-        self.save_config(config)
+        self.save_config(replace(
+            config,
+            project=features,
+            project_description=description or config.project_description,
+        ))
 
     def clear_project(self) -> None:
         """Clear project settings (e.g., when switching projects)."""
         config = self.config
-        config.project = FeatureSettings()
-        config.project_description = ""
-        self.save_config(config)
+        # Already clear: skip the serialize + rewrite
+        if config.project == FeatureSettings.EMPTY and not config.project_description:
+            return
+        self.save_config(replace(config, project=FeatureSettings.EMPTY, project_description=""))
 
     def resolve_features(self, session_override: FeatureSettings | None = None) -> FeatureSettings:
         """Resolve features through all tiers.
@@ -490,23 +544,31 @@ class ConfigManager:
         Returns:
             Fully resolved FeatureSettings with defaults filled in
         """
-        # Start with defaults
-        resolved = self.config.defaults
+        # The override-free result stays valid until save_config() runs
+        config = self.config
+        if session_override is None and self._resolved_for is config:
+            return self._resolved
 
-        # Apply project overrides
-        resolved = resolved.merge_with(self.config.project)
+        # Start with defaults, then apply project overrides
+        resolved = config.defaults.merge_with(config.project)
 
         # Apply session overrides
         if session_override:
             resolved = resolved.merge_with(session_override)
 
         # Fill in system defaults for any remaining None values
+        # (model can remain None to use Claude's default). Path.cwd() is
+        # only consulted when no tier set a working_dir.
+        system_defaults = {}
         if resolved.working_dir is None:
-            resolved.working_dir = Path.cwd()
+            system_defaults["working_dir"] = Path.cwd()
         if resolved.session_prefix is None:
-            resolved.session_prefix = self.DEFAULT_SESSION_PREFIX
-        # model can remain None (use Claude's default)
+            system_defaults["session_prefix"] = self.DEFAULT_SESSION_PREFIX
+        if system_defaults:
+            resolved = replace(resolved, **system_defaults)
 
+        if session_override is None:
+            self._resolved_for, self._resolved = config, resolved
         return resolved
 
     def get_proxy_settings(self) -> ProxySettings | None:
@@ -526,11 +588,11 @@ class ConfigManager:
     @property
     def portal(self):
         """Backward compatibility: portal is now the project section."""
-        from dataclasses import dataclass, field
+        from dataclasses import dataclass
 
         @dataclass
         class _PortalCompat:
-            features: FeatureSettings = field(default_factory=FeatureSettings)
+            features: FeatureSettings = FeatureSettings.EMPTY
             description: str = ""
 
         config = self.config
@@ -20,6 +20,7 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from typing import Any, Callable, Generic, TypeVar
+import inspect
 import logging
 import weakref
 
@@ -29,7 +30,7 @@ logger = logging.getLogger(__name__)
 E = TypeVar("E", bound="Event")
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Base class for all domain events."""
 
@@ -39,7 +40,7 @@ class Event:
 # Session Events
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionCreatedEvent(Event):
     """Emitted when a session is created."""
 
@@ -48,7 +49,7 @@ class SessionCreatedEvent(Event):
     session_type: str = ""  # "ai" or "shell"
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionStateChangedEvent(Event):
     """Emitted when session state changes (running/paused/killed)."""
 
@@ -57,28 +58,28 @@ class SessionStateChangedEvent(Event):
     new_state: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionPausedEvent(Event):
     """Emitted when a session is paused (tmux ended, worktree preserved)."""
 
     session_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionKilledEvent(Event):
     """Emitted when a session is killed (tmux ended, worktree removed)."""
 
     session_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionCleanedEvent(Event):
     """Emitted when a paused session's worktree is cleaned."""
 
     session_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionOutputEvent(Event):
     """Emitted when new session output is available."""
 
@@ -86,7 +87,7 @@ class SessionOutputEvent(Event):
     output: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionTokenUpdateEvent(Event):
     """Emitted when token counts are updated for a session."""
 
@@ -111,7 +112,7 @@ class ProxyHealthStatus(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class ProxyStatusChangedEvent(Event):
     """Emitted when proxy status changes."""
 
@@ -123,7 +124,7 @@ class ProxyStatusChangedEvent(Event):
 # Config Events
 
 
-@dataclass
+@dataclass(slots=True)
 class ConfigChangedEvent(Event):
     """Emitted when configuration is updated."""
 
@@ -134,6 +135,20 @@ class ConfigChangedEvent(Event):
 EventHandler = Callable[[Event], None]
 
 
+def _weak_handler_ref(
+    handler: EventHandler,
+    callback: Callable[[weakref.ref], Any] | None = None,
+) -> weakref.ref:
+    """Weak reference to a handler.
+
+    Bound methods get a WeakMethod, since a plain ref to the transient
+    method object would die immediately.
+    """
+    if inspect.ismethod(handler):
+        return weakref.WeakMethod(handler, callback)
+    return weakref.ref(handler, callback)
+
+
 class EventBus:
     """Central event bus for service-to-UI communication.
 
@@ -144,8 +159,12 @@ class EventBus:
     _instance: "EventBus | None" = None
 
     def __init__(self) -> None:
-        self._subscribers: dict[type[Event], list[EventHandler]] = {}
-        self._weak_subscribers: dict[type[Event], list[weakref.ref]] = {}
+        # Insertion-ordered dicts used as sets: O(1) dedup and removal
+        self._subscribers: dict[type[Event], dict[EventHandler, None]] = {}
+        # Immutable handler snapshots for emit, rebuilt only on (un)subscribe
+        self._snapshots: dict[type[Event], tuple[EventHandler, ...]] = {}
+        # Weak refs remove themselves via callback when the handler dies
+        self._weak_subscribers: dict[type[Event], dict[weakref.ref, None]] = {}
 
     @classmethod
     def get(cls) -> "EventBus":
@@ -173,14 +192,13 @@ class EventBus:
             weak: Use weak reference (auto-cleanup when handler owner is GC'd)
         """
         if weak:
-            if event_type not in self._weak_subscribers:
-                self._weak_subscribers[event_type] = []
-            self._weak_subscribers[event_type].append(weakref.ref(handler))
+            subscribers = self._weak_subscribers.setdefault(event_type, {})
+            ref = _weak_handler_ref(handler, lambda r: subscribers.pop(r, None))
+            subscribers.setdefault(ref, None)
         else:
-            if event_type not in self._subscribers:
-                self._subscribers[event_type] = []
-            if handler not in self._subscribers[event_type]:
-                self._subscribers[event_type].append(handler)
+            handlers = self._subscribers.setdefault(event_type, {})
+            handlers.setdefault(handler, None)
+            self._snapshots[event_type] = tuple(handlers)
 
     def unsubscribe(
         self,
@@ -189,10 +207,16 @@ class EventBus:
     ) -> None:
         """Unsubscribe from an event type."""
         if event_type in self._subscribers:
+            handlers = self._subscribers[event_type]
+            handlers.pop(handler, None)
+            self._snapshots[event_type] = tuple(handlers)
+        if event_type in self._weak_subscribers:
+            # Live refs compare equal by referent, so a fresh ref finds the entry
             try:
-                self._subscribers[event_type].remove(handler)
-            except ValueError:
-                pass  # Handler not in list
+                ref = _weak_handler_ref(handler)
+            except TypeError:
+                return  # Not weakly referenceable, so never a weak subscriber
+            self._weak_subscribers[event_type].pop(ref, None)
 
     def emit(self, event: Event) -> None:
         """Emit an event to all subscribers.
@@ -201,34 +225,30 @@ class EventBus:
         """
         event_type = type(event)
 
-        # Call strong reference handlers
-        handlers = self._subscribers.get(event_type, [])
-        for handler in handlers:
+        # Call strong reference handlers (snapshot: handlers may unsubscribe)
+        for handler in self._snapshots.get(event_type, ()):
             try:
                 handler(event)
             except Exception as e:
                 logger.error(f"Event handler error for {event_type.__name__}: {e}")
 
-        # Call weak reference handlers (cleanup dead refs)
-        weak_handlers = self._weak_subscribers.get(event_type, [])
-        live_refs = []
-        for ref in weak_handlers:
+        # Call weak reference handlers (dead refs already removed themselves)
+        for ref in list(self._weak_subscribers.get(event_type, ())):
             handler = ref()
             if handler is not None:
-                live_refs.append(ref)
                 try:
                     handler(event)
                 except Exception as e:
                     logger.error(f"Event handler error for {event_type.__name__}: {e}")
-        self._weak_subscribers[event_type] = live_refs
 
     def subscriber_count(self, event_type: type[Event]) -> int:
         """Get number of subscribers for an event type (for debugging)."""
-        strong = len(self._subscribers.get(event_type, []))
-        weak = len([r for r in self._weak_subscribers.get(event_type, []) if r() is not None])
+        strong = len(self._subscribers.get(event_type, ()))
+        weak = len(self._weak_subscribers.get(event_type, ()))
         return strong + weak
 
     def clear(self) -> None:
         """Clear all subscribers (for testing)."""
         self._subscribers.clear()
+        self._snapshots.clear()
         self._weak_subscribers.clear()
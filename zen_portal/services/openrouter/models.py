@@ -1,9 +1,12 @@
 """OpenRouter models service for fetching and caching available models."""
 
+import bisect
+import heapq
 import json
 import os
 import time
-from dataclasses import dataclass
+from collections import OrderedDict
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Callable
 import urllib.request
@@ -20,6 +23,13 @@ class OpenRouterModel:
     pricing_prompt: float  # per 1M tokens
     pricing_completion: float  # per 1M tokens
     description: str = ""
+    # Lowercased copies for search, computed once per model
+    id_lower: str = field(init=False, repr=False, compare=False)
+    name_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.id_lower = self.id.lower()
+        self.name_lower = self.name.lower()
 
     @property
     def short_id(self) -> str:
@@ -48,6 +58,29 @@ class OpenRouterModel:
             description=data.get("description", "")[:200],  # Truncate long descriptions
         )
 
+    @classmethod
+    def from_cache_dict(cls, data: dict) -> "OpenRouterModel":
+        """Create from a disk cache entry written by to_cache_dict."""
+        return cls(
+            data["id"],
+            data["name"],
+            data["context_length"],
+            data["pricing_prompt"],
+            data["pricing_completion"],
+            data.get("description", ""),
+        )
+
+    def to_cache_dict(self) -> dict:
+        """Serialize for the disk cache."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "context_length": self.context_length,
+            "pricing_prompt": self.pricing_prompt,
+            "pricing_completion": self.pricing_completion,
+            "description": self.description,
+        }
+
 
 class OpenRouterModelsService:
     """Service for fetching and caching OpenRouter models.
@@ -59,6 +92,11 @@ class OpenRouterModelsService:
     API_URL = "https://openrouter.ai/api/v1/models"
     CACHE_TTL_SECONDS = 24 * 60 * 60  # 24 hours
 
+    SEARCH_CACHE_SIZE = 64
+
+    # Search match tiers, best first
+    _EXACT, _ID_PREFIX, _ID_CONTAINS, _NAME_PREFIX, _NAME_CONTAINS, _FUZZY, _NO_MATCH = range(7)
+
     def __init__(self, cache_dir: Path | None = None):
         if cache_dir is None:
             cache_dir = Path.home() / ".cache" / "zen-portal"
@@ -66,6 +104,12 @@ class OpenRouterModelsService:
         self._cache_file = cache_dir / "openrouter_models.json"
         self._models: list[OpenRouterModel] | None = None
         self._last_fetch: float = 0
+        # Recent search results, valid only for the models list they came from
+        self._search_cache: OrderedDict[tuple[str, int], list[OpenRouterModel]] = OrderedDict()
+        self._search_cache_for: list[OpenRouterModel] | None = None
+        # Lowercased IDs in sorted order, with each model's list position
+        self._id_index: list[str] = []
+        self._id_positions: list[int] = []
 
     def get_models(
         self,
@@ -128,56 +172,86 @@ class OpenRouterModelsService:
             return models[:limit]
 
         query_lower = query.lower()
-        results: list[tuple[int, OpenRouterModel]] = []
-
-        for model in models:
-            score = self._match_score(model, query_lower)
-            if score > 0:
-                results.append((score, model))
-
-        # Sort by score (higher = better match)
-        results.sort(key=lambda x: -x[0])
-        return [m for _, m in results[:limit]]
+        if models is not self._search_cache_for:
+            self._reset_search_state(models)
+        key = (query_lower, limit)
+        cached = self._search_cache.get(key)
+        if cached is not None:
+            self._search_cache.move_to_end(key)
+            return list(cached)
+
+        prefixed = self._id_prefix_matches(models, query_lower)
+        if len(prefixed) >= limit:
+            # Only an exact match outranks an ID prefix match, so the
+            # prefix range alone fills the results without a full scan
+            prefixed.sort(key=lambda m: m.id_lower != query_lower)
+            results = prefixed[:limit]
+        else:
+            scored = [
+                (tier, model)
+                for model in models
+                if (tier := self._match_tier(model, query_lower)) < self._NO_MATCH
+            ]
+            # nsmallest is stable, so equal tiers keep provider/name order
+            best = heapq.nsmallest(limit, scored, key=lambda x: x[0])
+            results = [m for _, m in best]
+
+        self._search_cache[key] = results
+        if len(self._search_cache) > self.SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return list(results)
+
+    def _reset_search_state(self, models: list[OpenRouterModel]) -> None:
+        """Drop cached results and rebuild the ID index for a new model list."""
+        self._search_cache.clear()
+        self._search_cache_for = models
+        order = sorted(range(len(models)), key=lambda i: models[i].id_lower)
+        self._id_index = [models[i].id_lower for i in order]
+        self._id_positions = order
+
+    def _id_prefix_matches(
+        self, models: list[OpenRouterModel], query: str
+    ) -> list[OpenRouterModel]:
+        """Models whose ID starts with query, in list order (binary search)."""
+        lo = bisect.bisect_left(self._id_index, query)
+        hi = bisect.bisect_left(self._id_index, query + "\U0010ffff", lo)
+        return [models[i] for i in sorted(self._id_positions[lo:hi])]
 
-    def _match_score(self, model: OpenRouterModel, query: str) -> int:
-        """Calculate match score for a model.
+    def _match_tier(self, model: OpenRouterModel, query: str) -> int:
+        """Classify how well a model matches an already-lowercased query.
 
-        Higher score = better match.
-        Returns 0 if no match.
+        Lower tier = better match. Returns _NO_MATCH if nothing matches.
         """
-        id_lower = model.id.lower()
-        name_lower = model.name.lower()
-
-        # Exact ID match
+        id_lower = model.id_lower
         if id_lower == query:
-            return 1000
-
-        # ID starts with query
+            return self._EXACT
         if id_lower.startswith(query):
-            return 500
-
-        # ID contains query
+            return self._ID_PREFIX
         if query in id_lower:
-            return 300
+            return self._ID_CONTAINS
 
-        # Name starts with query
+        name_lower = model.name_lower
         if name_lower.startswith(query):
-            return 200
-
-        # Name contains query
+            return self._NAME_PREFIX
         if query in name_lower:
-            return 100
+            return self._NAME_CONTAINS
 
         # Fuzzy: all query chars present in order
         if self._fuzzy_match(query, id_lower) or self._fuzzy_match(query, name_lower):
-            return 50
+            return self._FUZZY
 
-        return 0
+        return self._NO_MATCH
 
     def _fuzzy_match(self, query: str, text: str) -> bool:
         """Check if all query chars appear in text in order."""
-        text_idx = 0
-        for char in query:
+        if not query:
+            return True
+        # Cheap reject: the last char must occur after the first one
+        start = text.find(query[0])
+        if start == -1 or text.rfind(query[-1]) < start:
+            return False
+        text_idx = start + 1
+        for char in query[1:]:
             found = text.find(char, text_idx)
             if found == -1:
                 return False
@@ -217,7 +291,7 @@ class OpenRouterModelsService:
             return None
 
         try:
-            data = json.loads(self._cache_file.read_text())
+            data = json.loads(self._cache_file.read_bytes())
             cached_at = data.get("cached_at", 0)
 
             # Check TTL unless ignoring
@@ -226,18 +300,9 @@ class OpenRouterModelsService:
                     return None
 
             self._last_fetch = cached_at
-            return [
-                OpenRouterModel(
-                    id=m["id"],
-                    name=m["name"],
-                    context_length=m["context_length"],
-                    pricing_prompt=m["pricing_prompt"],
-                    pricing_completion=m["pricing_completion"],
-                    description=m.get("description", ""),
-                )
-                for m in data.get("models", [])
-            ]
-        except (json.JSONDecodeError, KeyError, TypeError):
+            from_cache = OpenRouterModel.from_cache_dict
+            return [from_cache(m) for m in data.get("models", [])]
+        except (json.JSONDecodeError, UnicodeDecodeError, KeyError, TypeError):
             return None
 
     def _save_cache(self, models: list[OpenRouterModel]) -> None:
@@ -246,20 +311,10 @@ class OpenRouterModelsService:
 
         data = {
             "cached_at": time.time(),
-            "models": [
-                {
-                    "id": m.id,
-                    "name": m.name,
-                    "context_length": m.context_length,
-                    "pricing_prompt": m.pricing_prompt,
-                    "pricing_completion": m.pricing_completion,
-                    "description": m.description,
-                }
-                for m in models
-            ],
+            "models": [m.to_cache_dict() for m in models],
         }
 
-        self._cache_file.write_text(json.dumps(data))
+        self._cache_file.write_bytes(json.dumps(data, separators=(",", ":")).encode())
 
     def get_model_by_id(self, model_id: str) -> OpenRouterModel | None:
         """Get a specific model by ID."""
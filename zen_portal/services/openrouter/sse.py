@@ -0,0 +1,120 @@
+"""Streaming chat completion wire format for the OpenRouter API.
+
+Encodes request bodies and collects server-sent event (SSE) streams back
+into the non-streaming response shape, working on bytes throughout.
+"""
+
+import functools
+import json
+from typing import Iterator
+
+
+def encode_message(role: str, content: str) -> bytes:
+    """Serialize a single chat message to JSON bytes."""
+    return json.dumps({"role": role, "content": content}).encode("utf-8")
+
+
+@functools.lru_cache(maxsize=64)
+def encode_system_message(system_prompt: str) -> bytes:
+    """Serialize a system message, cached since @ref context repeats."""
+    return encode_message("system", system_prompt)
+
+
+def build_payload(model: str, prompt: str, system_prompt: str, max_tokens: int) -> bytes:
+    """Encode a streaming chat completion request body.
+
+    The system message is serialized once per distinct system prompt and
+    spliced in as bytes; only the user message is encoded per call.
+
+    Args:
+        model: OpenRouter model ID
+        prompt: The user message
+        system_prompt: System context, omitted when empty
+        max_tokens: Generation budget for the reply
+
+    Returns:
+        JSON request body
+    """
+    messages = [encode_message("user", prompt)]
+    if system_prompt:
+        messages.insert(0, encode_system_message(system_prompt))
+    return b'{"model":%b,"messages":[%b],"max_tokens":%d,"stream":true}' % (
+        json.dumps(model).encode("utf-8"),
+        b",".join(messages),
+        max_tokens,
+    )
+
+
+def iter_sse_events(stream, chunk_size: int = 16384) -> Iterator[bytes]:
+    """Yield the data payload of each server-sent event as raw bytes.
+
+    Framing works on a bytearray buffer so nothing is decoded before the
+    JSON parser, which accepts bytes directly. Events without a data field
+    (keep-alive comments like ": OPENROUTER PROCESSING") are skipped. CRLF
+    and lone CR line endings are normalized to LF before framing.
+    """
+    buf = bytearray()
+    held_cr = b""
+    while True:
+        chunk = stream.read1(chunk_size)
+        if chunk:
+            chunk = held_cr + chunk
+            # A trailing CR may be the first half of a CRLF split across reads
+            held_cr = b"\r" if chunk.endswith(b"\r") else b""
+            if held_cr:
+                chunk = chunk[:-1]
+            if b"\r" in chunk:
+                chunk = chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+        elif held_cr:
+            # The stream ended on a lone CR, which terminates the line
+            chunk, held_cr = b"\n", b""
+        else:
+            break
+        buf += chunk
+        start = 0
+        while (end := buf.find(b"\n\n", start)) != -1:
+            data = [
+                line[5:].lstrip(b" ")
+                for line in buf[start:end].split(b"\n")
+                if line.startswith(b"data:")
+            ]
+            start = end + 2
+            if data:
+                yield bytes(b"\n".join(data))
+        del buf[:start]
+
+
+def read_stream(resp, max_length: int) -> dict:
+    """Collect a streamed completion into the non-streaming response shape.
+
+    Stops reading once max_length characters have arrived; closing the
+    connection early cancels the rest of the generation upstream.
+
+    Args:
+        resp: Binary response stream supporting read1()
+        max_length: Character budget for the reply
+
+    Returns:
+        Dict with "choices" and "usage", or "error" on a mid-stream error
+    """
+    parts: list[str] = []
+    length = 0
+    data: dict = {}
+    for payload in iter_sse_events(resp):
+        if payload == b"[DONE]":
+            break
+        event = json.loads(payload)
+        if "error" in event:
+            return {"error": event["error"]}
+        if event.get("usage"):
+            data["usage"] = event["usage"]
+        choices = event.get("choices") or []
+        content = choices[0].get("delta", {}).get("content") if choices else None
+        if content:
+            parts.append(content)
+            length += len(content)
+            if length > max_length:
+                break
+    if parts:
+        data["choices"] = [{"message": {"content": "".join(parts)}}]
+    return data
@@ -49,20 +49,25 @@ class ProfileManager:
             self._profile = self._load_profile()
         return self._profile
 
+    def reload(self) -> UserProfile:
+        """Re-read the profile from disk, discarding the in-memory copy."""
+        self._profile = self._load_profile()
+        return self._profile
+
     def _load_profile(self) -> UserProfile:
         """Load profile from disk."""
         if self._profile_file.exists():
             try:
-                data = json.loads(self._profile_file.read_text())
+                data = json.loads(self._profile_file.read_bytes())
                 return UserProfile.from_dict(data)
-            except (json.JSONDecodeError, KeyError, ValueError):
+            except (json.JSONDecodeError, UnicodeDecodeError, KeyError, ValueError):
                 pass
         return UserProfile()
 
     def save_profile(self, profile: UserProfile) -> None:
         """Save profile to disk."""
         self._profile_dir.mkdir(parents=True, exist_ok=True)
-        self._profile_file.write_text(json.dumps(profile.to_dict(), indent=2))
+        self._profile_file.write_bytes(json.dumps(profile.to_dict(), indent=2).encode("utf-8"))
         self._profile = profile
 
     def update_theme(self, theme: str) -> None:
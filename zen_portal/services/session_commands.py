@@ -1,12 +1,13 @@
 """Session command building for different session types."""
 
+import functools
 import os
 import re
 import shlex
 import shutil
 import tempfile
 from pathlib import Path
-from urllib.parse import urlparse
+from urllib.parse import urlsplit
 
 from ..models.session import Session, SessionType
 from .banner import generate_banner_command
@@ -18,11 +19,86 @@ _TMUX_CMD_LENGTH_THRESHOLD = 12000  # Leave margin for banner and other parts
 
 # Validation patterns
 _API_KEY_PATTERN = re.compile(r'^[a-zA-Z0-9_-]+$')
+_MODEL_NAME_PATTERN = re.compile(r'^[a-zA-Z0-9/_:.-]+$')
 _SAFE_URL_SCHEMES = frozenset({'http', 'https'})
+_SAFE_URL_PREFIXES = ('http://', 'https://')
 _MAX_API_KEY_LENGTH = 256
+_MAX_MODEL_NAME_LENGTH = 128
 _MAX_URL_LENGTH = 2048
 
 
+@functools.lru_cache(maxsize=32)
+def _sanitize_url(url: str) -> str | None:
+    """Validate and sanitize a URL for use as an API base URL.
+
+    Returns the sanitized URL or None if invalid.
+    """
+    if not url or len(url) > _MAX_URL_LENGTH:
+        return None
+    # Cheap reject for other schemes and scheme-less input before parsing
+    if not url.lstrip()[:8].lower().startswith(_SAFE_URL_PREFIXES):
+        return None
+
+    try:
+        parsed = urlsplit(url)
+        # Only allow http/https schemes
+        if parsed.scheme not in _SAFE_URL_SCHEMES:
+            return None
+        # Must have a host
+        if not parsed.netloc:
+            return None
+        # Drop ;params from the last path segment, as urlparse would
+        path = parsed.path
+        semi = path.find(";", path.rfind("/") + 1)
+        if semi != -1:
+            path = path[:semi]
+        # Reconstruct to normalize (removes potential obfuscation)
+        return f"{parsed.scheme}://{parsed.netloc}{path}".rstrip("/")
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=32)
+def _sanitize_api_key(key: str) -> str | None:
+    """Validate an API key for safe use in environment variables.
+
+    Returns the key if valid, None otherwise.
+    API keys should be alphanumeric with dashes/underscores only.
+    """
+    if not key or len(key) > _MAX_API_KEY_LENGTH:
+        return None
+
+    # Strip whitespace
+    key = key.strip()
+
+    # Check for safe characters only (alphanumeric, dash, underscore)
+    # Most API keys follow this pattern (sk-or-xxx, sk-ant-xxx, etc.)
+    if not _API_KEY_PATTERN.match(key):
+        return None
+
+    return key
+
+
+@functools.lru_cache(maxsize=32)
+def _sanitize_model_name(model: str) -> str | None:
+    """Validate a model name for safe use.
+
+    Returns the model name if valid, None otherwise.
+    Model names should be alphanumeric with common separators.
+    """
+    if not model or len(model) > _MAX_MODEL_NAME_LENGTH:
+        return None
+
+    model = model.strip()
+
+    # Allow alphanumeric, dash, underscore, slash, colon, period
+    # e.g., "anthropic/claude-sonnet-4", "openai/gpt-4o:beta"
+    if not _MODEL_NAME_PATTERN.match(model):
+        return None
+
+    return model
+
+
 class SessionCommandBuilder:
     """Builds shell commands for different session types."""
 
@@ -182,63 +258,11 @@ class SessionCommandBuilder:
             command_args.extend(["--model", model.value])
         return command_args
 
-    def _validate_url(self, url: str) -> str | None:
-        """Validate and sanitize a URL for use as an API base URL.
-
-        Returns the sanitized URL or None if invalid.
-        """
-        if not url or len(url) > _MAX_URL_LENGTH:
-            return None
-
-        try:
-            parsed = urlparse(url)
-            # Only allow http/https schemes
-            if parsed.scheme not in _SAFE_URL_SCHEMES:
-                return None
-            # Must have a host
-            if not parsed.netloc:
-                return None
-            # Reconstruct to normalize (removes potential obfuscation)
-            return f"{parsed.scheme}://{parsed.netloc}{parsed.path}".rstrip("/")
-        except Exception:
-            return None
-
-    def _validate_api_key(self, key: str) -> str | None:
-        """Validate an API key for safe use in environment variables.
-
-        Returns the key if valid, None otherwise.
-        API keys should be alphanumeric with dashes/underscores only.
-        """
-        if not key or len(key) > _MAX_API_KEY_LENGTH:
-            return None
-
-        # Strip whitespace
-        key = key.strip()
-
-        # Check for safe characters only (alphanumeric, dash, underscore)
-        # Most API keys follow this pattern (sk-or-xxx, sk-ant-xxx, etc.)
-        if not _API_KEY_PATTERN.match(key):
-            return None
-
-        return key
-
-    def _validate_model_name(self, model: str) -> str | None:
-        """Validate a model name for safe use.
-
-        Returns the model name if valid, None otherwise.
-        Model names should be alphanumeric with common separators.
-        """
-        if not model or len(model) > 128:
-            return None
-
-        model = model.strip()
-
-        # Allow alphanumeric, dash, underscore, slash, colon, period
-        # e.g., "anthropic/claude-sonnet-4", "openai/gpt-4o:beta"
-        if not re.match(r'^[a-zA-Z0-9/_:.-]+$', model):
-            return None
-
-        return model
+    # Validators are pure and see the same few settings values on every
+    # session launch, so they are memoized module functions
+    _validate_url = staticmethod(_sanitize_url)
+    _validate_api_key = staticmethod(_sanitize_api_key)
+    _validate_model_name = staticmethod(_sanitize_model_name)
 
     def build_proxy_env_vars(
         self,
@@ -261,21 +285,21 @@ class SessionCommandBuilder:
         env_vars = {}
 
         # Use effective_base_url which applies default
-        validated_url = self._validate_url(proxy_settings.effective_base_url)
+        validated_url = _sanitize_url(proxy_settings.effective_base_url)
         if validated_url:
             env_vars["ANTHROPIC_BASE_URL"] = validated_url
 
         # OpenRouter API key for y-router
         api_key = proxy_settings.api_key or os.environ.get("OPENROUTER_API_KEY", "")
         if api_key:
-            validated_key = self._validate_api_key(api_key)
+            validated_key = _sanitize_api_key(api_key)
             if validated_key:
                 env_vars["ANTHROPIC_API_KEY"] = validated_key
                 env_vars["ANTHROPIC_CUSTOM_HEADERS"] = f"x-api-key: {validated_key}"
 
         # Model override (OpenRouter uses provider/model format)
         if proxy_settings.default_model:
-            validated_model = self._validate_model_name(proxy_settings.default_model)
+            validated_model = _sanitize_model_name(proxy_settings.default_model)
             if validated_model:
                 env_vars["ANTHROPIC_MODEL"] = validated_model
 
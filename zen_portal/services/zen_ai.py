@@ -18,6 +18,7 @@ See: services/config.py ZenAIConfig for settings
 """
 
 import asyncio
+import codecs
 import json
 import logging
 import os
@@ -29,11 +30,28 @@ from urllib.request import Request, urlopen
 from urllib.error import URLError, HTTPError
 
 from .config import ProxySettings, ZenAIConfig, ZenAIModel, ZenAIProvider
+from .openrouter.sse import build_payload, read_stream
 
 
 logger = logging.getLogger(__name__)
 
 
+# Instruction appended to the system prompt when several prompts share one request
+BATCH_INSTRUCTION = (
+    "You will receive a JSON array of independent questions. Answer each one "
+    "separately and reply with only a JSON array of strings, one answer per "
+    "question, in the same order."
+)
+
+
+# claude -p --model argument for each tier
+CLAUDE_CLI_MODELS = {
+    ZenAIModel.HAIKU: "haiku",
+    ZenAIModel.SONNET: "sonnet",
+    ZenAIModel.OPUS: "opus",
+}
+
+
 # OpenRouter model IDs for each tier
 OPENROUTER_MODELS = {
     ZenAIModel.HAIKU: "anthropic/claude-3-haiku",
@@ -42,6 +60,13 @@ OPENROUTER_MODELS = {
 }
 
 
+# Output token ceiling for each OpenRouter tier; a batch never asks for more
+OPENROUTER_OUTPUT_TOKEN_LIMITS = {
+    ZenAIModel.HAIKU: 4096,
+    ZenAIModel.SONNET: 64000,
+    ZenAIModel.OPUS: 32000,
+}
+
 @dataclass
 class ZenAIResult:
     """Result of a Zen AI query."""
@@ -68,6 +93,10 @@ class ZenAI:
     # Maximum response length (characters)
     MAX_RESPONSE_LENGTH = 10000
 
+    # Generation budget for API requests (~4 characters per token), so the
+    # model stops near MAX_RESPONSE_LENGTH instead of generating text we drop
+    MAX_TOKENS = max(256, MAX_RESPONSE_LENGTH // 4)
+
     def __init__(
         self,
         config: ZenAIConfig,
@@ -76,6 +105,33 @@ class ZenAI:
         self.config = config
         self.proxy_settings = proxy_settings
 
+    @property
+    def proxy_settings(self) -> ProxySettings | None:
+        """Proxy settings applied to claude -p invocations."""
+        return self._proxy_settings
+
+    @proxy_settings.setter
+    def proxy_settings(self, value: ProxySettings | None) -> None:
+        self._proxy_settings = value
+        self._claude_env = self._build_claude_env()
+
+    def _build_claude_env(self) -> dict[str, str] | None:
+        """Build the subprocess environment with proxy overrides applied.
+
+        Returns None without a proxy so the subprocess simply inherits the
+        current environment instead of receiving a copy of it.
+        """
+        if not (self.proxy_settings and self.proxy_settings.enabled):
+            return None
+        env = {
+            **os.environ,
+            "ANTHROPIC_BASE_URL": self.proxy_settings.effective_base_url,
+        }
+        api_key = self._get_api_key()
+        if api_key:
+            env["ANTHROPIC_API_KEY"] = api_key
+        return env
+
     @property
     def is_available(self) -> bool:
         """Check if Zen AI is available and configured."""
@@ -98,6 +154,21 @@ class ZenAI:
             return self.proxy_settings.api_key
         return os.environ.get("OPENROUTER_API_KEY", "")
 
+    def _truncate_output(self, raw: bytes) -> str:
+        """Decode subprocess output, bounded to MAX_RESPONSE_LENGTH characters.
+
+        The byte buffer is cut before decoding (UTF-8 is at most 4 bytes per
+        character) so runaway output never materializes as a full string; a
+        non-final decode drops a character split by the cut instead of U+FFFD.
+        """
+        truncated = len(raw) > self.MAX_RESPONSE_LENGTH * 4
+        raw = raw[:self.MAX_RESPONSE_LENGTH * 4]
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        response = decoder.decode(raw, final=not truncated).strip()
+        if truncated or len(response) > self.MAX_RESPONSE_LENGTH:
+            response = response[:self.MAX_RESPONSE_LENGTH] + "..."
+        return response
+
     async def query(
         self,
         prompt: str,
@@ -124,6 +195,102 @@ class ZenAI:
         else:
             return await self._query_openrouter_api(prompt, system_prompt)
 
+    async def query_batch(
+        self,
+        prompts: list[str],
+        system_prompt: str = "",
+    ) -> list[ZenAIResult]:
+        """Execute several independent prompts that share a system prompt.
+
+        On OpenRouter the prompts are coalesced into requests for a JSON array
+        of answers, grouped so each answer keeps a single query's budget within
+        the model's output token limit. A group whose request fails or whose
+        reply can't be split per prompt is queried individually.
+
+        Args:
+            prompts: Independent user prompts
+            system_prompt: System context shared by every prompt
+
+        Returns:
+            One ZenAIResult per prompt, in order
+        """
+        if not prompts:
+            return []
+
+        batch_size = self._batch_size()
+        if (
+            len(prompts) > 1
+            and batch_size > 1
+            and self.is_available
+            and self.config.provider == ZenAIProvider.OPENROUTER
+        ):
+            groups = await asyncio.gather(*(
+                self._query_group(prompts[i:i + batch_size], system_prompt)
+                for i in range(0, len(prompts), batch_size)
+            ))
+            return [result for group in groups for result in group]
+
+        return await self._query_each(prompts, system_prompt)
+
+    def _batch_size(self) -> int:
+        """Most prompts one request can answer within the output token limit."""
+        # A custom model's limit is unknown, so assume the smallest tier's
+        limit = OPENROUTER_OUTPUT_TOKEN_LIMITS[ZenAIModel.HAIKU]
+        if not self.config.openrouter_model:
+            limit = OPENROUTER_OUTPUT_TOKEN_LIMITS.get(self.config.model, limit)
+        return max(1, limit // self.MAX_TOKENS)
+
+    async def _query_each(self, prompts: list[str], system_prompt: str) -> list[ZenAIResult]:
+        """Query every prompt on its own, concurrently."""
+        return list(await asyncio.gather(
+            *(self.query(prompt, system_prompt) for prompt in prompts)
+        ))
+
+    async def _query_group(self, prompts: list[str], system_prompt: str) -> list[ZenAIResult]:
+        """Answer a group of prompts with one batched OpenRouter request."""
+        if len(prompts) == 1:
+            return await self._query_each(prompts, system_prompt)
+
+        batch_system = f"{system_prompt}\n\n{BATCH_INSTRUCTION}" if system_prompt else BATCH_INSTRUCTION
+        # Every answer gets the budget of a single query
+        result = await self._query_openrouter_api(
+            json.dumps(prompts),
+            batch_system,
+            max_length=self.MAX_RESPONSE_LENGTH * len(prompts),
+        )
+        if result.success:
+            answers = self._split_batch_response(result.response, len(prompts))
+            if answers is not None:
+                tokens = result.tokens_used // len(prompts)
+                return [
+                    ZenAIResult(success=True, response=answer, tokens_used=tokens)
+                    for answer in answers
+                ]
+            logger.debug("Batch response not splittable, querying individually")
+        else:
+            logger.debug(f"Batch request failed ({result.error}), querying individually")
+
+        return await self._query_each(prompts, system_prompt)
+
+    @staticmethod
+    def _split_batch_response(response: str, expected: int) -> list[str] | None:
+        """Parse a batched reply into answers, or None if it doesn't fit."""
+        text = response.strip()
+        if text.startswith("```"):
+            # Tolerate a fenced code block around the array
+            text = text.strip("`").removeprefix("json").strip()
+        try:
+            answers = json.loads(text)
+        except ValueError:
+            return None
+        if (
+            not isinstance(answers, list)
+            or len(answers) != expected
+            or not all(isinstance(a, str) for a in answers)
+        ):
+            return None
+        return [a.strip() for a in answers]
+
     async def _query_claude_pipe(
         self,
         prompt: str,
@@ -131,50 +298,38 @@ class ZenAI:
     ) -> ZenAIResult:
         """Query Claude using pipe mode subprocess."""
         try:
-            # Build command
-            cmd = ["claude", "-p"]
-            if self.config.model == ZenAIModel.OPUS:
-                cmd.extend(["--model", "opus"])
-            elif self.config.model == ZenAIModel.SONNET:
-                cmd.extend(["--model", "sonnet"])
-            else:
-                cmd.extend(["--model", "haiku"])
+            cmd = [
+                "claude", "-p", "--model",
+                CLAUDE_CLI_MODELS.get(self.config.model, "haiku"),
+            ]
 
             # Combine system prompt and user prompt
             full_prompt = prompt
             if system_prompt:
                 full_prompt = f"{system_prompt}\n\n---\n\n{prompt}"
 
-            # Build environment with proxy settings if configured
-            env = os.environ.copy()
-            if self.proxy_settings and self.proxy_settings.enabled:
-                env["ANTHROPIC_BASE_URL"] = self.proxy_settings.effective_base_url
-                api_key = self._get_api_key()
-                if api_key:
-                    env["ANTHROPIC_API_KEY"] = api_key
-
-            # Run subprocess
+            # Run subprocess (bytes mode so oversize output is cut before decoding)
             result = await asyncio.to_thread(
                 subprocess.run,
                 cmd,
-                input=full_prompt,
+                input=full_prompt.encode("utf-8"),
                 capture_output=True,
-                text=True,
                 timeout=self.SUBPROCESS_TIMEOUT,
-                env=env,
+                env=self._claude_env,
             )
 
             if result.returncode != 0:
-                error_msg = result.stderr.strip() if result.stderr else "unknown error"
+                error_msg = (
+                    result.stderr[:800].decode("utf-8", errors="replace").strip()
+                    if result.stderr else ""
+                ) or "unknown error"
                 return ZenAIResult(
                     success=False,
                     response="",
                     error=error_msg[:200],  # Truncate long errors
                 )
 
-            response = result.stdout.strip()
-            if len(response) > self.MAX_RESPONSE_LENGTH:
-                response = response[:self.MAX_RESPONSE_LENGTH] + "..."
+            response = self._truncate_output(result.stdout)
 
             return ZenAIResult(
                 success=True,
@@ -200,12 +355,34 @@ class ZenAI:
                 error=str(e)[:100],
             )
 
+    def _build_payload(
+        self,
+        prompt: str,
+        system_prompt: str = "",
+        max_tokens: int | None = None,
+    ) -> bytes:
+        """Encode the chat completion request body for the configured model."""
+        return build_payload(
+            self.config.effective_model,
+            prompt,
+            system_prompt,
+            max_tokens or self.MAX_TOKENS,
+        )
+
     async def _query_openrouter_api(
         self,
         prompt: str,
         system_prompt: str = "",
+        max_length: int | None = None,
     ) -> ZenAIResult:
-        """Query OpenRouter API directly."""
+        """Query OpenRouter API directly.
+
+        Args:
+            prompt: The user prompt
+            system_prompt: Optional system context
+            max_length: Response character budget (default MAX_RESPONSE_LENGTH)
+        """
+        max_length = max_length or self.MAX_RESPONSE_LENGTH
         api_key = self._get_api_key()
         if not api_key:
             return ZenAIResult(
@@ -215,22 +392,9 @@ class ZenAI:
             )
 
         try:
-            # Build messages
-            messages = []
-            if system_prompt:
-                messages.append({"role": "system", "content": system_prompt})
-            messages.append({"role": "user", "content": prompt})
-
-            # Build request
-            payload = {
-                "model": self.config.effective_model,
-                "messages": messages,
-                "max_tokens": 2048,
-            }
-
             request = Request(
                 "https://openrouter.ai/api/v1/chat/completions",
-                data=json.dumps(payload).encode("utf-8"),
+                data=self._build_payload(prompt, system_prompt, max(256, max_length // 4)),
                 headers={
                     "Authorization": f"Bearer {api_key}",
                     "Content-Type": "application/json",
@@ -243,15 +407,21 @@ class ZenAI:
             # Execute request in thread pool
             def do_request():
                 with urlopen(request, timeout=self.API_TIMEOUT) as resp:
-                    return json.loads(resp.read().decode())
+                    return read_stream(resp, max_length)
 
             data = await asyncio.to_thread(do_request)
 
             # Extract response
+            if "error" in data:
+                return ZenAIResult(
+                    success=False,
+                    response="",
+                    error=str(data["error"].get("message", "api error"))[:100],
+                )
             if "choices" in data and len(data["choices"]) > 0:
                 response = data["choices"][0]["message"]["content"]
-                if len(response) > self.MAX_RESPONSE_LENGTH:
-                    response = response[:self.MAX_RESPONSE_LENGTH] + "..."
+                if len(response) > max_length:
+                    response = response[:max_length] + "..."
 
                 tokens = 0
                 if "usage" in data:
@@ -311,13 +481,18 @@ class ZenAI:
 
         For now, this is a simple wrapper that yields the full response.
         True streaming can be added later for better UX.
+
+        Chunks are paced by config.stream_delay; with the default of 0 the
+        loop only yields to the event loop and the UI's render tick sets
+        the pace.
         """
         result = await self.query(prompt, system_prompt)
         if result.success:
             # Simulate streaming by yielding in chunks
             chunk_size = 50
+            delay = self.config.stream_delay
             for i in range(0, len(result.response), chunk_size):
                 yield result.response[i:i + chunk_size]
-                await asyncio.sleep(0.02)  # Small delay for visual effect
+                await asyncio.sleep(max(delay, 0.0))
         else:
             yield f"[error: {result.error}]"
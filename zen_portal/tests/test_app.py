@@ -22,3 +22,33 @@ def test_app_instantiation(monkeypatch):
     app = ZenPortalApp()
     assert app is not None
     assert hasattr(app, "notification_service")
+
+
+def test_app_shares_zen_ai(monkeypatch):
+    """App exposes a single shared ZenAI instance."""
+    import shutil
+
+    monkeypatch.setattr(shutil, "which", lambda cmd: "/usr/bin/mock")
+
+    from zen_portal.app import ZenPortalApp
+    app = ZenPortalApp()
+    assert app.zen_ai is app.zen_ai
+    assert app.zen_ai is app.services.zen_ai
+
+
+def test_app_zen_ai_follows_saved_config(monkeypatch, tmp_path):
+    """Shared ZenAI picks up Zen AI settings saved after startup."""
+    import shutil
+
+    monkeypatch.setattr(shutil, "which", lambda cmd: "/usr/bin/mock")
+
+    from zen_portal.app import ZenPortalApp
+    from zen_portal.services.config import Config, ConfigManager, FeatureSettings, ZenAIConfig
+    app = ZenPortalApp()
+    app.services.config = ConfigManager(config_dir=tmp_path / "config")
+    zen_ai = app.zen_ai
+    assert not zen_ai.config.enabled
+
+    app.services.config.save_config(Config(defaults=FeatureSettings(zen_ai=ZenAIConfig(enabled=True))))
+    assert app.zen_ai is zen_ai
+    assert zen_ai.config.enabled
@@ -8,6 +8,7 @@ from zen_portal.services.config import (
     ConfigManager,
     Config,
     FeatureSettings,
+    ProxySettings,
     ClaudeModel,
     ExitBehavior,
 )
@@ -52,6 +53,12 @@ class TestFeatureSettings:
         assert settings.model == ClaudeModel.SONNET
         assert settings.session_prefix == "zen"
 
+    def test_from_dict_unknown_model_ignored(self):
+        """Unknown model values fall back to None instead of failing."""
+        settings = FeatureSettings.from_dict({"model": "gpt-4", "session_prefix": "zen"})
+        assert settings.model is None
+        assert settings.session_prefix == "zen"
+
     def test_merge_with_override(self, tmp_path: Path):
         """Override values take precedence."""
         base = FeatureSettings(
@@ -86,6 +93,13 @@ class TestFeatureSettings:
         assert merged.model == ClaudeModel.SONNET
         assert merged.session_prefix == "test"
 
+    def test_merge_with_empty_returns_base(self, tmp_path: Path):
+        """Merging an all-None override returns the base unchanged."""
+        base = FeatureSettings(working_dir=tmp_path)
+
+        assert base.merge_with(FeatureSettings.EMPTY) is base
+        assert base.merge_with(FeatureSettings()) is base
+
     def test_enabled_session_types_to_dict(self):
         """Session types serialize correctly."""
         settings = FeatureSettings(enabled_session_types=["claude", "shell"])
@@ -104,6 +118,12 @@ class TestFeatureSettings:
         assert settings.enabled_session_types is None
         assert "enabled_session_types" not in settings.to_dict()
 
+    def test_settings_are_immutable(self):
+        """Settings are frozen; changes go through dataclasses.replace."""
+        settings = FeatureSettings(session_prefix="zen")
+        with pytest.raises(AttributeError):
+            settings.session_prefix = "other"
+
     def test_enabled_session_types_merge(self):
         """Session types merge correctly."""
         base = FeatureSettings(enabled_session_types=["claude", "shell"])
@@ -137,12 +157,27 @@ class TestConfigManager:
         )
         manager.save_config(config)
 
-        # New manager should load persisted config
+        # New manager should load persisted config from disk
+        ConfigManager._invalidate(config_dir)
         manager2 = ConfigManager(config_dir=config_dir)
         assert manager2.config.exit_behavior == ExitBehavior.KILL_ALL
         assert manager2.config.defaults.working_dir == tmp_path
         assert manager2.config.defaults.model == ClaudeModel.HAIKU
 
+    @pytest.mark.parametrize(
+        "data",
+        [{"exit_behavior": ["ask"]}, {"defaults": {"model": ["opus"]}}],
+        ids=["exit_behavior", "model"],
+    )
+    def test_unhashable_enum_value_falls_back_to_defaults(self, tmp_path: Path, data: dict):
+        """Malformed enum values load as a default config instead of raising."""
+        config_dir = tmp_path / "config"
+        config_dir.mkdir()
+        (config_dir / "config.json").write_text(json.dumps(data))
+
+        manager = ConfigManager(config_dir=config_dir)
+        assert manager.config == Config()
+
     def test_project_defaults(self, tmp_path: Path):
         """Fresh project settings have expected defaults."""
         manager = ConfigManager(config_dir=tmp_path / "config")
@@ -160,7 +195,8 @@ class TestConfigManager:
             description="Working on zen-portal",
         )
 
-        # New manager should load persisted project settings
+        # New manager should load persisted project settings from disk
+        ConfigManager._invalidate(config_dir)
         manager2 = ConfigManager(config_dir=config_dir)
         assert manager2.config.project.working_dir == tmp_path / "project"
         assert manager2.config.project_description == "Working on zen-portal"
@@ -177,6 +213,15 @@ class TestConfigManager:
 
         assert manager.config.project.working_dir is None
 
+    def test_clear_empty_project_skips_write(self, tmp_path: Path):
+        """Clearing already-empty project settings doesn't touch disk."""
+        config_dir = tmp_path / "config"
+        manager = ConfigManager(config_dir=config_dir)
+
+        manager.clear_project()
+
+        assert not (config_dir / "config.json").exists()
+
     def test_resolve_features_defaults(self, tmp_path: Path):
         """Resolve fills in system defaults."""
         manager = ConfigManager(config_dir=tmp_path / "config")
@@ -189,6 +234,46 @@ class TestConfigManager:
         # Model can remain None (Claude's default)
         assert resolved.model is None
 
+    def test_resolve_features_memoized_until_save(self, tmp_path: Path):
+        """Repeated resolves reuse the result until config changes."""
+        manager = ConfigManager(config_dir=tmp_path / "config")
+
+        first = manager.resolve_features()
+        assert manager.resolve_features() is first
+
+        manager.update_project_features(FeatureSettings(model=ClaudeModel.HAIKU))
+        resolved = manager.resolve_features()
+        assert resolved is not first
+        assert resolved.model == ClaudeModel.HAIKU
+
+    def test_resolve_features_recomputed_after_saving_same_config(self, tmp_path: Path):
+        """Saving an edited nested setting drops the memo even for the same Config."""
+        manager = ConfigManager(config_dir=tmp_path / "config")
+        manager.save_config(Config(defaults=FeatureSettings(openrouter_proxy=ProxySettings(enabled=True))))
+        config = manager.config
+        assert manager.resolve_features().openrouter_proxy.enabled is True
+
+        config.defaults.openrouter_proxy.enabled = False
+        manager.save_config(config)
+
+        assert manager.resolve_features().openrouter_proxy.enabled is False
+
+    def test_disabling_proxy_invalidates_resolved(self, tmp_path: Path):
+        """Switching billing back to Claude is seen by the next resolve."""
+        from zen_portal.screens.new_session.billing_widget import BillingWidget
+
+        manager = ConfigManager(config_dir=tmp_path / "config")
+        manager.save_config(Config(
+            defaults=FeatureSettings(openrouter_proxy=ProxySettings(enabled=True, api_key="sk-or-test")),
+            project=FeatureSettings(openrouter_proxy=ProxySettings(default_model="anthropic/claude-sonnet-4")),
+        ))
+        assert manager.resolve_features().openrouter_proxy.enabled is True
+
+        # Unmounted widget reports Claude billing, taking the disable path
+        BillingWidget(manager, None).save_settings()
+
+        assert manager.resolve_features().openrouter_proxy.enabled is False
+
     def test_resolve_features_defaults_level(self, tmp_path: Path):
         """Default-level settings are applied."""
         config_dir = tmp_path / "config"
@@ -207,6 +292,17 @@ class TestConfigManager:
         assert resolved.working_dir == tmp_path / "defaults-level"
         assert resolved.model == ClaudeModel.SONNET
 
+    def test_resolve_features_skips_cwd_when_set(self, tmp_path: Path, monkeypatch):
+        """cwd is not consulted when a tier provides working_dir."""
+        manager = ConfigManager(config_dir=tmp_path / "config")
+        manager.save_config(Config(defaults=FeatureSettings(working_dir=tmp_path)))
+
+        def fail_cwd():
+            raise AssertionError("Path.cwd() should not be called")
+
+        monkeypatch.setattr(Path, "cwd", fail_cwd)
+        assert manager.resolve_features().working_dir == tmp_path
+
     def test_resolve_features_project_overrides_defaults(self, tmp_path: Path):
         """Project-level settings override defaults."""
         config_dir = tmp_path / "config"
@@ -290,6 +386,15 @@ class TestConfigManager:
         assert resolved.model == ClaudeModel.SONNET
         assert resolved.session_prefix == "custom"
 
+    def test_config_cached_across_managers(self, tmp_path: Path):
+        """Managers for the same directory share one loaded config."""
+        config_dir = tmp_path / "config"
+        manager = ConfigManager(config_dir=config_dir)
+        manager.save_config(Config(exit_behavior=ExitBehavior.KILL_DEAD))
+
+        manager2 = ConfigManager(config_dir=config_dir)
+        assert manager2.config is manager.config
+
 
 class TestConfigManagerBackwardCompatibility:
     """Tests for backward compatibility."""
@@ -303,5 +408,6 @@ class TestConfigManagerBackwardCompatibility:
         manager.save(config)  # Deprecated
 
         # Should work
+        ConfigManager._invalidate(config_dir)
         manager2 = ConfigManager(config_dir=config_dir)
         assert manager2.config.exit_behavior == ExitBehavior.KEEP_ALL
@@ -1,5 +1,8 @@
 """Tests for EventBus service."""
 
+import gc
+import operator
+
 import pytest
 
 from zen_portal.services.events import (
@@ -20,10 +23,11 @@ from zen_portal.services.events import (
 
 @pytest.fixture
 def bus():
-    """Fresh event bus for each test."""
-    EventBus.reset()
-    yield EventBus.get()
-    EventBus.reset()
+    """Shared event bus with no subscribers, emptied again after each test."""
+    bus = EventBus.get()
+    bus.clear()
+    yield bus
+    EventBus.get().clear()
 
 
 class TestEventBusBasics:
@@ -96,6 +100,22 @@ class TestEventBusBasics:
 
         assert len(received) == 0
 
+    def test_unsubscribe_during_emit(self, bus):
+        """Handlers may unsubscribe themselves while being called."""
+        received = []
+
+        def once(event):
+            received.append(event)
+            bus.unsubscribe(SessionCreatedEvent, once)
+
+        bus.subscribe(SessionCreatedEvent, once)
+        bus.subscribe(SessionCreatedEvent, received.append)
+
+        bus.emit(SessionCreatedEvent(session_id="test", session_name="test"))
+
+        assert len(received) == 2
+        assert bus.subscriber_count(SessionCreatedEvent) == 1
+
     def test_unsubscribe_nonexistent_handler(self, bus):
         """Unsubscribing non-subscribed handler doesn't raise."""
 
@@ -249,3 +269,42 @@ class TestWeakReferences:
         # Should not have received second event (handler was GC'd)
         # Note: This test may be flaky if GC doesn't run immediately
         # In practice, this provides eventual cleanup
+
+    def test_weak_subscriber_removed_when_collected(self, bus):
+        """Dead weak subscribers drop out without waiting for an emit."""
+        handler = lambda event: None  # noqa: E731
+        bus.subscribe(SessionCreatedEvent, handler, weak=True)
+        assert bus.subscriber_count(SessionCreatedEvent) == 1
+
+        del handler
+        gc.collect()
+
+        assert bus.subscriber_count(SessionCreatedEvent) == 0
+
+    def test_weak_bound_method_subscriber(self, bus):
+        """Bound methods stay subscribed while their owner is alive."""
+        received = []
+
+        class Screen:
+            def on_created(self, event):
+                received.append(event)
+
+        screen = Screen()
+        bus.subscribe(SessionCreatedEvent, screen.on_created, weak=True)
+        bus.emit(SessionCreatedEvent(session_id="test"))
+        assert len(received) == 1
+
+        bus.unsubscribe(SessionCreatedEvent, screen.on_created)
+        bus.emit(SessionCreatedEvent(session_id="test2"))
+        assert len(received) == 1
+
+    def test_unsubscribe_non_weakrefable_beside_weak(self, bus):
+        """Strong handlers that can't be weakly referenced still unsubscribe."""
+        weak_handler = lambda event: None  # noqa: E731
+        strong_handler = operator.itemgetter(0)
+        bus.subscribe(SessionCreatedEvent, weak_handler, weak=True)
+        bus.subscribe(SessionCreatedEvent, strong_handler)
+
+        bus.unsubscribe(SessionCreatedEvent, strong_handler)
+
+        assert bus.subscriber_count(SessionCreatedEvent) == 1
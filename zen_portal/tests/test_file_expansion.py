@@ -3,7 +3,12 @@
 import pytest
 from pathlib import Path
 
-from zen_portal.screens.new_session_modal import expand_file_reference, _MAX_PROMPT_FILE_SIZE
+from zen_portal.screens.new_session_modal import (
+    expand_file_reference,
+    _MAX_PROMPT_FILE_SIZE,
+    _PROMPT_CACHE,
+    _PROMPT_CACHE_MAX_FILE_SIZE,
+)
 
 
 class TestExpandFileReference:
@@ -92,6 +97,15 @@ class TestExpandFileReference:
         assert text == "Line 1\nLine 2\nLine 3"
         assert err is None
 
+    def test_crlf_newlines_normalized(self, tmp_path):
+        """Windows line endings are read as plain newlines."""
+        test_file = tmp_path / "crlf.md"
+        test_file.write_bytes(b"Line 1\r\nLine 2\r\n")
+
+        text, err = expand_file_reference(f"@{test_file}")
+        assert text == "Line 1\nLine 2"
+        assert err is None
+
     def test_at_in_middle_of_text_unchanged(self):
         """@ in middle of text is not treated as file reference."""
         text, err = expand_file_reference("email@example.com")
@@ -175,3 +189,33 @@ class TestExpandFileReference:
         text, err = expand_file_reference(f"@{link}")
         assert text == "Target content"
         assert err is None
+
+    def test_edited_file_reread(self, tmp_path):
+        """Cached reads are invalidated when the file changes."""
+        prompt = tmp_path / "prompt.md"
+        prompt.write_text("first version")
+        assert expand_file_reference(f"@{prompt}") == ("first version", None)
+
+        prompt.write_text("second, longer version")
+        assert expand_file_reference(f"@{prompt}") == ("second, longer version", None)
+
+    def test_edit_replaces_cache_entry(self, tmp_path):
+        """An edited file keeps one cache entry rather than adding another."""
+        prompt = tmp_path / "prompt.md"
+        prompt.write_text("first version")
+        expand_file_reference(f"@{prompt}")
+        prompt.write_text("second, longer version")
+        expand_file_reference(f"@{prompt}")
+
+        assert [k for k in _PROMPT_CACHE if k.startswith(str(tmp_path))] == [str(prompt)]
+        assert _PROMPT_CACHE[str(prompt)][2] == "second, longer version"
+
+    def test_large_file_not_cached(self, tmp_path):
+        """Files above the cache threshold are read but not held."""
+        prompt = tmp_path / "large.md"
+        prompt.write_text("x" * (_PROMPT_CACHE_MAX_FILE_SIZE + 1))
+
+        text, err = expand_file_reference(f"@{prompt}")
+        assert err is None
+        assert len(text) == _PROMPT_CACHE_MAX_FILE_SIZE + 1
+        assert str(prompt) not in _PROMPT_CACHE
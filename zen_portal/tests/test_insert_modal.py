@@ -74,19 +74,22 @@ class TestSpecialKeys:
 class TestInsertModal:
     """Tests for InsertModal."""
 
+    @pytest.fixture
+    def modal(self):
+        """Uncomposed modal for buffer tests."""
+        return InsertModal("test")
+
     def test_insert_modal_has_session_name(self):
         """InsertModal stores session name."""
         modal = InsertModal("my-session")
         assert modal._session_name == "my-session"
 
-    def test_insert_modal_buffer_starts_empty(self):
+    def test_insert_modal_buffer_starts_empty(self, modal):
         """InsertModal buffer starts empty."""
-        modal = InsertModal("test")
         assert modal._buffer == []
 
-    def test_add_literal(self):
+    def test_add_literal(self, modal):
         """_add_literal adds a KeyItem to buffer."""
-        modal = InsertModal("test")
         modal._buffer = []  # Ensure clean start
         # Manually add since _add_literal calls _update_buffer_display which needs compose
         item = KeyItem(value="a", display="a", is_special=False)
@@ -95,31 +98,27 @@ class TestInsertModal:
         assert modal._buffer[0].value == "a"
         assert not modal._buffer[0].is_special
 
-    def test_add_special(self):
+    def test_add_special(self, modal):
         """Special keys are added with is_special=True."""
-        modal = InsertModal("test")
         item = KeyItem(value="Up", display="↑", is_special=True)
         modal._buffer.append(item)
         assert modal._buffer[0].is_special
         assert modal._buffer[0].value == "Up"
 
-    def test_get_display_text_empty(self):
+    def test_get_display_text_empty(self, modal):
         """Empty buffer shows placeholder."""
-        modal = InsertModal("test")
         assert modal._get_display_text() == "type to capture..."
 
-    def test_get_display_text_literals(self):
+    def test_get_display_text_literals(self, modal):
         """Display text shows literal characters."""
-        modal = InsertModal("test")
         modal._buffer = [
             KeyItem(value="h", display="h"),
             KeyItem(value="i", display="i"),
         ]
         assert modal._get_display_text() == "hi"
 
-    def test_get_display_text_special_keys(self):
+    def test_get_display_text_special_keys(self, modal):
         """Display text shows special keys in brackets."""
-        modal = InsertModal("test")
         modal._buffer = [
             KeyItem(value="hello", display="hello"),
             KeyItem(value="Down", display="↓", is_special=True),
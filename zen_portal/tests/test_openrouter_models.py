@@ -133,74 +133,89 @@ class TestOpenRouterModelsService:
             ),
         ]
 
-    def test_search_models_exact_match(self, service, sample_models):
-        """Test exact ID match ranks highest."""
+    @pytest.fixture
+    def loaded_service(self, service, sample_models):
+        """Service with sample models already in memory."""
         service._models = sample_models
         service._last_fetch = time.time()
+        return service
 
-        results = service.search_models("anthropic/claude-sonnet-4")
+    def test_search_models_exact_match(self, loaded_service):
+        """Test exact ID match ranks highest."""
+        results = loaded_service.search_models("anthropic/claude-sonnet-4")
         assert results[0].id == "anthropic/claude-sonnet-4"
 
-    def test_search_models_prefix_match(self, service, sample_models):
+    def test_search_models_prefix_match(self, loaded_service):
         """Test prefix matching."""
-        service._models = sample_models
-        service._last_fetch = time.time()
-
-        results = service.search_models("anthropic/claude")
+        results = loaded_service.search_models("anthropic/claude")
         assert len(results) == 2
         assert all("claude" in r.id for r in results)
 
-    def test_search_models_contains_match(self, service, sample_models):
+    def test_search_models_contains_match(self, loaded_service):
         """Test substring matching."""
-        service._models = sample_models
-        service._last_fetch = time.time()
-
-        results = service.search_models("sonnet")
+        results = loaded_service.search_models("sonnet")
         assert len(results) == 1
         assert results[0].id == "anthropic/claude-sonnet-4"
 
-    def test_search_models_name_match(self, service, sample_models):
+    def test_search_models_name_match(self, loaded_service):
         """Test matching by name."""
-        service._models = sample_models
-        service._last_fetch = time.time()
-
-        results = service.search_models("GPT")
+        results = loaded_service.search_models("GPT")
         assert len(results) == 1
         assert results[0].id == "openai/gpt-4o"
 
-    def test_search_models_fuzzy_match(self, service, sample_models):
+    def test_search_models_fuzzy_match(self, loaded_service):
         """Test fuzzy matching (chars in order)."""
-        service._models = sample_models
-        service._last_fetch = time.time()
-
-        results = service.search_models("clsnt")  # c-l-s-n-t in claude-sonnet
+        results = loaded_service.search_models("clsnt")  # c-l-s-n-t in claude-sonnet
         assert len(results) >= 1
         assert any("claude-sonnet" in r.id for r in results)
 
-    def test_search_models_empty_query(self, service, sample_models):
+    def test_search_models_empty_query(self, loaded_service, sample_models):
         """Test empty query returns all models."""
-        service._models = sample_models
-        service._last_fetch = time.time()
-
-        results = service.search_models("")
+        results = loaded_service.search_models("")
         assert len(results) == len(sample_models)
 
-    def test_search_models_limit(self, service, sample_models):
+    def test_search_models_limit(self, loaded_service):
         """Test limit parameter."""
-        service._models = sample_models
-        service._last_fetch = time.time()
-
-        results = service.search_models("", limit=2)
+        results = loaded_service.search_models("", limit=2)
         assert len(results) == 2
 
-    def test_search_models_no_match(self, service, sample_models):
+    def test_search_models_no_match(self, loaded_service):
         """Test no match returns empty list."""
-        service._models = sample_models
-        service._last_fetch = time.time()
-
-        results = service.search_models("zzzznonexistent")
+        results = loaded_service.search_models("zzzznonexistent")
         assert len(results) == 0
 
+    def test_search_models_tier_order(self, loaded_service):
+        """Test ID prefix outranks name match, ties keep list order."""
+        results = loaded_service.search_models("CLAUDE")
+        assert [r.id for r in results] == [
+            "anthropic/claude-sonnet-4",
+            "anthropic/claude-opus-4",
+        ]
+
+    def test_search_models_limit_keeps_best(self, loaded_service):
+        """Test limit returns the best matches, not the first matches."""
+        results = loaded_service.search_models("gemini", limit=1)
+        assert [r.id for r in results] == ["google/gemini-pro"]
+
+    def test_search_models_prefix_fills_limit(self, loaded_service):
+        """Test a prefix range that fills the limit puts the exact match first."""
+        results = loaded_service.search_models("anthropic/claude-opus-4", limit=1)
+        assert [r.id for r in results] == ["anthropic/claude-opus-4"]
+
+        results = loaded_service.search_models("ANTHROPIC/", limit=2)
+        assert [r.id for r in results] == [
+            "anthropic/claude-sonnet-4",
+            "anthropic/claude-opus-4",
+        ]
+
+    def test_search_models_cached_per_models_list(self, loaded_service):
+        """Test repeat searches are cached until the model list is replaced."""
+        first = loaded_service.search_models("claude")
+        assert loaded_service.search_models("Claude") == first
+
+        loaded_service._models = loaded_service._models[2:]
+        assert loaded_service.search_models("claude") == []
+
     def test_cache_save_and_load(self, service, sample_models, temp_cache_dir):
         """Test cache persistence."""
         service._save_cache(sample_models)
@@ -262,21 +277,15 @@ class TestOpenRouterModelsService:
         assert loaded is not None
         assert len(loaded) == len(sample_models)
 
-    def test_get_model_by_id(self, service, sample_models):
+    def test_get_model_by_id(self, loaded_service):
         """Test getting model by ID."""
-        service._models = sample_models
-        service._last_fetch = time.time()
-
-        model = service.get_model_by_id("openai/gpt-4o")
+        model = loaded_service.get_model_by_id("openai/gpt-4o")
         assert model is not None
         assert model.name == "GPT-4o"
 
-    def test_get_model_by_id_not_found(self, service, sample_models):
+    def test_get_model_by_id_not_found(self, loaded_service):
         """Test getting non-existent model."""
-        service._models = sample_models
-        service._last_fetch = time.time()
-
-        model = service.get_model_by_id("nonexistent/model")
+        model = loaded_service.get_model_by_id("nonexistent/model")
         assert model is None
 
 
@@ -297,6 +306,12 @@ class TestFuzzyMatch:
         assert service._fuzzy_match("abc", "acb") is False  # Wrong order
         assert service._fuzzy_match("xyz", "abc") is False
 
+    def test_fuzzy_match_last_char_before_first(self, service):
+        """Test rejection when the last query char only precedes the first."""
+        assert service._fuzzy_match("ba", "ab") is False
+        assert service._fuzzy_match("aa", "a") is False
+        assert service._fuzzy_match("a", "a") is True
+
     def test_fuzzy_match_exact(self, service):
         """Test exact string fuzzy matches."""
         assert service._fuzzy_match("test", "test") is True
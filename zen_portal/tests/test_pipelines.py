@@ -1,81 +1,101 @@
 """Tests for pipeline module and create session pipeline."""
 
 import pytest
-from pathlib import Path
-from unittest.mock import Mock, MagicMock
+from dataclasses import dataclass, field
+from typing import Any
 
 from zen_portal.services.pipeline import StepResult, run_pipeline
-from zen_portal.services.pipelines.create import (
-    CreateContext,
-    ValidateBinary,
-    ResolveConfig,
-    CreateSessionModel,
-)
+from zen_portal.services.pipelines.create import CreateContext, ValidateBinary
 from zen_portal.services.conflict import (
     detect_conflicts,
     has_blocking_conflict,
     get_conflict_summary,
     ConflictSeverity,
 )
-from zen_portal.models.session import Session, SessionState, SessionType
+from zen_portal.models.session import Session, SessionType
+
+
+@dataclass
+class FakeStep:
+    """Pipeline step returning a canned result and recording its inputs."""
+
+    result: StepResult
+    calls: list[Any] = field(default_factory=list)
+
+    def invoke(self, value: Any) -> StepResult:
+        self.calls.append(value)
+        return self.result
+
+
+@dataclass
+class FakeCommands:
+    """Session commands stub for ValidateBinary."""
+
+    error: str | None = None
+    calls: list[tuple] = field(default_factory=list)
+
+    def validate_binary(self, session_type: SessionType, provider: str) -> str | None:
+        self.calls.append((session_type, provider))
+        return self.error
 
 
 class TestStepResult:
     """Tests for StepResult dataclass."""
 
-    def test_success_creates_ok_result(self):
-        result = StepResult.success("value")
-        assert result.ok is True
-        assert result.value == "value"
-        assert result.error is None
-
-    def test_fail_creates_error_result(self):
-        result = StepResult.fail("error message")
-        assert result.ok is False
-        assert result.value is None
-        assert result.error == "error message"
+    @pytest.mark.parametrize(
+        "result,ok,value,error",
+        [
+            (StepResult.success("value"), True, "value", None),
+            (StepResult.fail("error message"), False, None, "error message"),
+        ],
+        ids=["success", "fail"],
+    )
+    def test_constructors(self, result, ok, value, error):
+        assert result.ok is ok
+        assert result.value == value
+        assert result.error == error
 
 
 class TestRunPipeline:
     """Tests for run_pipeline function."""
 
     def test_runs_all_steps_on_success(self):
-        step1 = Mock(invoke=Mock(return_value=StepResult.success(2)))
-        step2 = Mock(invoke=Mock(return_value=StepResult.success(4)))
+        step1 = FakeStep(StepResult.success(2))
+        step2 = FakeStep(StepResult.success(4))
 
         result = run_pipeline([step1, step2], 1)
 
         assert result.ok is True
         assert result.value == 4
-        step1.invoke.assert_called_once_with(1)
-        step2.invoke.assert_called_once_with(2)
+        assert step1.calls == [1]
+        assert step2.calls == [2]
 
     def test_stops_on_first_failure(self):
-        step1 = Mock(invoke=Mock(return_value=StepResult.fail("step1 failed")))
-        step2 = Mock(invoke=Mock(return_value=StepResult.success("never called")))
+        step1 = FakeStep(StepResult.fail("step1 failed"))
+        step2 = FakeStep(StepResult.success("never called"))
 
         result = run_pipeline([step1, step2], "input")
 
         assert result.ok is False
         assert result.error == "step1 failed"
-        step2.invoke.assert_not_called()
+        assert step2.calls == []
 
 
 class TestValidateBinary:
     """Tests for ValidateBinary step."""
 
     def test_passes_when_binary_exists(self):
-        commands = Mock(validate_binary=Mock(return_value=None))
+        commands = FakeCommands()
         step = ValidateBinary(commands)
         ctx = CreateContext(name="test", session_type=SessionType.AI, provider="claude")
 
         result = step.invoke(ctx)
 
         assert result.ok is True
-        commands.validate_binary.assert_called_once_with(SessionType.AI, "claude")
+        assert commands.calls == [(SessionType.AI, "claude")]
 
     def test_fails_when_binary_missing(self):
-        commands = Mock(validate_binary=Mock(return_value="claude not found"))
+        commands = FakeCommands(error="claude not found")
         step = ValidateBinary(commands)
         ctx = CreateContext(name="test", session_type=SessionType.AI, provider="claude")
 
@@ -88,29 +108,24 @@ class TestValidateBinary:
 class TestConflictDetection:
     """Tests for conflict detection module."""
 
-    def test_detects_name_collision(self):
+    @pytest.mark.parametrize(
+        "name,expected",
+        [
+            ("my-session", [("name_collision", ConflictSeverity.WARNING)]),
+            ("new-unique-session", []),
+        ],
+        ids=["name-collision", "unique-name"],
+    )
+    def test_detect_conflicts(self, name, expected):
         existing = [Session(name="my-session")]
 
         conflicts = detect_conflicts(
-            name="my-session",
-            session_type=SessionType.AI,
-            existing=existing,
-        )
-
-        assert len(conflicts) == 1
-        assert conflicts[0].type == "name_collision"
-        assert conflicts[0].severity == ConflictSeverity.WARNING
-
-    def test_no_conflicts_with_unique_name(self):
-        existing = [Session(name="existing")]
-
-        conflicts = detect_conflicts(
-            name="new-unique-session",
+            name=name,
             session_type=SessionType.AI,
             existing=existing,
         )
 
-        assert len(conflicts) == 0
+        assert [(c.type, c.severity) for c in conflicts] == expected
 
     def test_has_blocking_conflict_without_error(self):
         existing = [Session(name="existing")]
@@ -76,8 +76,7 @@ class TestProfileManager:
         manager.update_theme("catppuccin-mocha")
 
         # Verify persisted
-        manager2 = ProfileManager(profile_dir=tmp_path)
-        assert manager2.profile.theme == "catppuccin-mocha"
+        assert manager.reload().theme == "catppuccin-mocha"
 
     def test_update_last_working_dir(self, tmp_path):
         """Last working dir can be updated."""
@@ -85,8 +84,18 @@ class TestProfileManager:
         manager.update_last_working_dir(Path("/home/user/projects"))
 
         # Verify persisted
-        manager2 = ProfileManager(profile_dir=tmp_path)
-        assert manager2.profile.last_working_dir == Path("/home/user/projects")
+        assert manager.reload().last_working_dir == Path("/home/user/projects")
+
+    def test_reload_picks_up_external_changes(self, tmp_path):
+        """reload re-reads a profile written by another manager."""
+        manager = ProfileManager(profile_dir=tmp_path)
+        assert manager.profile.theme is None
+
+        ProfileManager(profile_dir=tmp_path).update_theme("nord")
+
+        assert manager.profile.theme is None  # still the cached copy
+        assert manager.reload().theme == "nord"
+        assert manager.profile.theme == "nord"
 
     def test_profile_file_location(self, tmp_path):
         """Profile is saved to .profile file in profile dir."""
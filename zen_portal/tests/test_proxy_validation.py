@@ -1,8 +1,6 @@
 """Tests for ProxyValidator (y-router connectivity and configuration checks)."""
 
-import os
 import pytest
-from unittest.mock import patch, MagicMock
 
 from zen_portal.services.proxy_validation import (
     ProxyValidator,
@@ -18,165 +16,162 @@ from zen_portal.services.config import ProxySettings
 class TestProxyCheckResult:
     """Tests for ProxyCheckResult dataclass."""
 
-    def test_is_ok_when_status_ok(self):
-        result = ProxyCheckResult(ProxyStatus.OK, "Test")
-        assert result.is_ok is True
-        assert result.is_error is False
-
-    def test_is_error_when_status_error(self):
-        result = ProxyCheckResult(ProxyStatus.ERROR, "Test")
-        assert result.is_ok is False
-        assert result.is_error is True
-
-    def test_warning_is_neither_ok_nor_error(self):
-        result = ProxyCheckResult(ProxyStatus.WARNING, "Test")
-        assert result.is_ok is False
-        assert result.is_error is False
+    @pytest.mark.parametrize(
+        "status,is_ok,is_error",
+        [
+            (ProxyStatus.OK, True, False),
+            (ProxyStatus.ERROR, False, True),
+            (ProxyStatus.WARNING, False, False),
+        ],
+        ids=["ok", "error", "warning"],
+    )
+    def test_status_flags(self, status, is_ok, is_error):
+        result = ProxyCheckResult(status, "Test")
+        assert result.is_ok is is_ok
+        assert result.is_error is is_error
 
 
 class TestProxyValidationResult:
     """Tests for ProxyValidationResult aggregation."""
 
-    def test_is_ok_when_all_ok(self):
-        result = ProxyValidationResult(
-            connectivity=ProxyCheckResult(ProxyStatus.OK, "OK"),
-            credentials=ProxyCheckResult(ProxyStatus.OK, "OK"),
-            configuration=ProxyCheckResult(ProxyStatus.OK, "OK"),
+    @pytest.mark.parametrize(
+        "statuses,is_ok,has_errors,summary",
+        [
+            ((ProxyStatus.OK, ProxyStatus.OK, ProxyStatus.OK), True, False, "proxy ready"),
+            ((ProxyStatus.ERROR, ProxyStatus.OK, ProxyStatus.OK), False, True, "unreachable"),
+            (
+                (ProxyStatus.ERROR, ProxyStatus.ERROR, ProxyStatus.OK),
+                False,
+                True,
+                "unreachable, no credentials",
+            ),
+        ],
+        ids=["all-ok", "connectivity-error", "multiple-errors"],
+    )
+    def test_aggregation(self, statuses, is_ok, has_errors, summary):
+        connectivity, credentials, configuration = (
+            ProxyCheckResult(status, status.value) for status in statuses
         )
-        assert result.is_ok is True
-        assert result.has_errors is False
-
-    def test_has_errors_when_any_error(self):
         result = ProxyValidationResult(
-            connectivity=ProxyCheckResult(ProxyStatus.ERROR, "Error"),
-            credentials=ProxyCheckResult(ProxyStatus.OK, "OK"),
-            configuration=ProxyCheckResult(ProxyStatus.OK, "OK"),
+            connectivity=connectivity,
+            credentials=credentials,
+            configuration=configuration,
         )
-        assert result.is_ok is False
-        assert result.has_errors is True
+        assert result.is_ok is is_ok
+        assert result.has_errors is has_errors
+        assert result.summary == summary
 
-    def test_summary_when_ok(self):
-        result = ProxyValidationResult(
-            connectivity=ProxyCheckResult(ProxyStatus.OK, "OK"),
-            credentials=ProxyCheckResult(ProxyStatus.OK, "OK"),
-            configuration=ProxyCheckResult(ProxyStatus.OK, "OK"),
-        )
-        assert result.summary == "proxy ready"
 
-    def test_summary_lists_errors(self):
-        result = ProxyValidationResult(
-            connectivity=ProxyCheckResult(ProxyStatus.ERROR, "Error"),
-            credentials=ProxyCheckResult(ProxyStatus.ERROR, "Error"),
-            configuration=ProxyCheckResult(ProxyStatus.OK, "OK"),
-        )
-        assert "unreachable" in result.summary
-        assert "no credentials" in result.summary
+BASE_URL = "http://localhost:8787"
 
 
-class TestProxyValidatorCredentials:
-    """Tests for credential validation."""
+def _connectivity_ok(settings):
+    return ProxyCheckResult(ProxyStatus.OK, "Mocked")
 
-    def test_disabled_proxy_always_ok(self):
-        settings = ProxySettings(enabled=False)
-        validator = ProxyValidator(settings)
-        with patch.object(validator, '_check_connectivity', return_value=ProxyCheckResult(ProxyStatus.OK, "Mocked")):
-            result = validator.validate_sync()
-            assert result.credentials.is_ok
 
-    def test_error_without_api_key(self):
-        settings = ProxySettings(
-            enabled=True,
-            base_url="http://localhost:8787",
-            api_key="",
-        )
-        with patch.dict(os.environ, {}, clear=True):
-            validator = ProxyValidator(settings)
-            with patch.object(validator, '_check_connectivity', return_value=ProxyCheckResult(ProxyStatus.OK, "Mocked")):
-                result = validator.validate_sync()
-                assert result.credentials.is_error
-                assert "API key" in result.credentials.message
-
-    def test_ok_with_api_key_in_settings(self):
-        settings = ProxySettings(
-            enabled=True,
-            base_url="http://localhost:8787",
-            api_key="sk-or-test-key-12345",
-        )
-        validator = ProxyValidator(settings)
-        with patch.object(validator, '_check_connectivity', return_value=ProxyCheckResult(ProxyStatus.OK, "Mocked")):
-            result = validator.validate_sync()
-            assert result.credentials.is_ok
+@pytest.fixture
+def make_validator(monkeypatch):
+    """Build validators with connectivity stubbed and no key in the environment."""
+    monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
 
-    def test_ok_with_api_key_from_env(self):
-        settings = ProxySettings(
-            enabled=True,
-            base_url="http://localhost:8787",
-            api_key="",
-        )
-        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "sk-or-env-key-12345"}):
-            validator = ProxyValidator(settings)
-            with patch.object(validator, '_check_connectivity', return_value=ProxyCheckResult(ProxyStatus.OK, "Mocked")):
-                result = validator.validate_sync()
-                assert result.credentials.is_ok
+    def make(**settings) -> ProxyValidator:
+        validator = ProxyValidator(ProxySettings(**settings))
+        validator._check_connectivity = _connectivity_ok
+        return validator
 
-    def test_warning_for_non_openrouter_key_format(self):
-        settings = ProxySettings(
-            enabled=True,
-            base_url="http://localhost:8787",
-            api_key="some-other-format-key",
+    return make
+
+
+class TestProxyValidatorCredentials:
+    """Tests for credential validation."""
+
+    @pytest.mark.parametrize(
+        "settings,status",
+        [
+            ({"enabled": False}, ProxyStatus.OK),
+            ({"enabled": True, "base_url": BASE_URL, "api_key": ""}, ProxyStatus.ERROR),
+            ({"enabled": True, "base_url": BASE_URL, "api_key": "sk-or-test-key-12345"}, ProxyStatus.OK),
+            ({"enabled": True, "base_url": BASE_URL, "api_key": "some-other-format-key"}, ProxyStatus.WARNING),
+        ],
+        ids=["disabled", "no-key", "settings-key", "non-openrouter-key"],
+    )
+    def test_credentials_status(self, make_validator, settings, status):
+        result = make_validator(**settings).validate_sync()
+        assert result.credentials.status == status
+
+    def test_error_without_api_key_mentions_key(self, make_validator):
+        validator = make_validator(enabled=True, base_url=BASE_URL, api_key="")
+        result = validator.validate_sync()
+        assert "API key" in result.credentials.message
+
+    def test_ok_with_api_key_from_env(self, make_validator, monkeypatch):
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-env-key-12345")
+        validator = make_validator(enabled=True, base_url=BASE_URL, api_key="")
+        result = validator.validate_sync()
+        assert result.credentials.is_ok
+
+    def test_warning_for_non_openrouter_key_format_hint(self, make_validator):
+        validator = make_validator(
+            enabled=True, base_url=BASE_URL, api_key="some-other-format-key"
         )
-        validator = ProxyValidator(settings)
-        with patch.object(validator, '_check_connectivity', return_value=ProxyCheckResult(ProxyStatus.OK, "Mocked")):
-            result = validator.validate_sync()
-            assert result.credentials.status == ProxyStatus.WARNING
-            assert "sk-or-" in result.credentials.hint
+        result = validator.validate_sync()
+        assert "sk-or-" in result.credentials.hint
 
 
 class TestProxyValidatorConfiguration:
     """Tests for configuration validation."""
 
-    def test_model_without_provider_prefix_warning(self):
-        settings = ProxySettings(
+    @pytest.mark.parametrize(
+        "settings,status",
+        [
+            (
+                {"api_key": "sk-or-test-key", "default_model": "claude-sonnet-4"},
+                ProxyStatus.WARNING,
+            ),
+            (
+                {"api_key": "sk-or-test-key", "default_model": "anthropic/claude-sonnet-4"},
+                ProxyStatus.OK,
+            ),
+            ({"api_key": ""}, ProxyStatus.WARNING),
+        ],
+        ids=["model-without-provider", "model-with-provider", "missing-key"],
+    )
+    def test_configuration_status(self, make_validator, settings, status):
+        validator = make_validator(enabled=True, base_url=BASE_URL, **settings)
+        result = validator.validate_sync()
+        assert result.configuration.status == status
+
+    def test_model_without_provider_prefix_hint(self, make_validator):
+        validator = make_validator(
             enabled=True,
-            base_url="http://localhost:8787",
+            base_url=BASE_URL,
             api_key="sk-or-test-key",
             default_model="claude-sonnet-4",  # Missing provider prefix
         )
-        validator = ProxyValidator(settings)
-        with patch.object(validator, '_check_connectivity', return_value=ProxyCheckResult(ProxyStatus.OK, "Mocked")):
-            result = validator.validate_sync()
-            assert result.configuration.status == ProxyStatus.WARNING
-            assert "provider" in result.configuration.hint.lower()
+        result = validator.validate_sync()
+        assert "provider" in result.configuration.hint.lower()
 
-    def test_model_with_provider_prefix_ok(self):
-        settings = ProxySettings(
-            enabled=True,
-            base_url="http://localhost:8787",
-            api_key="sk-or-test-key",
-            default_model="anthropic/claude-sonnet-4",
-        )
-        validator = ProxyValidator(settings)
-        with patch.object(validator, '_check_connectivity', return_value=ProxyCheckResult(ProxyStatus.OK, "Mocked")):
-            result = validator.validate_sync()
-            assert result.configuration.is_ok
 
-    def test_missing_api_key_configuration_warning(self):
-        settings = ProxySettings(
-            enabled=True,
-            base_url="http://localhost:8787",
-            api_key="",
-        )
-        with patch.dict(os.environ, {}, clear=True):
-            validator = ProxyValidator(settings)
-            with patch.object(validator, '_check_connectivity', return_value=ProxyCheckResult(ProxyStatus.OK, "Mocked")):
-                result = validator.validate_sync()
-                assert result.configuration.status == ProxyStatus.WARNING
+class _RefusingSocket:
+    """Socket stub whose connect is always refused."""
+
+    def __init__(self, *args):
+        pass
+
+    def settimeout(self, timeout):
+        pass
+
+    def connect(self, address):
+        raise ConnectionRefusedError()
+
+    def close(self):
+        pass
 
 
 class TestProxyValidatorConnectivity:
     """Tests for connectivity checks."""
 
-    def test_connectivity_error_shows_hint(self):
+    def test_connectivity_error_shows_hint(self, monkeypatch):
         settings = ProxySettings(
             enabled=True,
             base_url="http://localhost:8787",
@@ -184,15 +179,11 @@ class TestProxyValidatorConnectivity:
         )
         validator = ProxyValidator(settings)
 
-        # Mock socket to fail
-        with patch('socket.socket') as mock_socket:
-            mock_sock = MagicMock()
-            mock_sock.connect.side_effect = ConnectionRefusedError()
-            mock_socket.return_value = mock_sock
-
-            result = validator._check_connectivity(settings)
-            assert result.is_error
-            assert "y-router" in result.hint.lower()
+        # Stub socket to fail
+        monkeypatch.setattr("socket.socket", _RefusingSocket)
+        result = validator._check_connectivity(settings)
+        assert result.is_error
+        assert "y-router" in result.hint.lower()
 
     def test_connectivity_ok_when_disabled(self):
         settings = ProxySettings(enabled=False)
@@ -225,32 +216,21 @@ class TestConvenienceFunctions:
         line = get_proxy_status_line(None)
         assert line == "proxy: disabled"
 
-    def test_get_proxy_status_line_ok(self):
-        settings = ProxySettings(
-            enabled=True,
-            base_url="http://localhost:8787",
-            api_key="sk-or-test-key",
-        )
-        with patch.object(ProxyValidator, 'validate_sync') as mock_validate:
-            mock_validate.return_value = ProxyValidationResult(
-                connectivity=ProxyCheckResult(ProxyStatus.OK, "OK"),
-                credentials=ProxyCheckResult(ProxyStatus.OK, "OK"),
-                configuration=ProxyCheckResult(ProxyStatus.OK, "OK"),
-            )
-            line = get_proxy_status_line(settings)
-            assert "y-router" in line
-
-    def test_get_proxy_status_line_error(self):
-        settings = ProxySettings(
-            enabled=True,
-            base_url="http://localhost:8787",
-            api_key="",
+    @pytest.mark.parametrize(
+        "connectivity,expected",
+        [
+            (ProxyCheckResult(ProxyStatus.OK, "OK"), "y-router"),
+            (ProxyCheckResult(ProxyStatus.ERROR, "Error"), "unreachable"),
+        ],
+        ids=["ok", "error"],
+    )
+    def test_get_proxy_status_line_enabled(self, monkeypatch, connectivity, expected):
+        result = ProxyValidationResult(
+            connectivity=connectivity,
+            credentials=ProxyCheckResult(ProxyStatus.OK, "OK"),
+            configuration=ProxyCheckResult(ProxyStatus.OK, "OK"),
         )
-        with patch.object(ProxyValidator, 'validate_sync') as mock_validate:
-            mock_validate.return_value = ProxyValidationResult(
-                connectivity=ProxyCheckResult(ProxyStatus.ERROR, "Error"),
-                credentials=ProxyCheckResult(ProxyStatus.OK, "OK"),
-                configuration=ProxyCheckResult(ProxyStatus.OK, "OK"),
-            )
-            line = get_proxy_status_line(settings)
-            assert "unreachable" in line
+        monkeypatch.setattr(ProxyValidator, "validate_sync", lambda self, settings=None: result)
+        settings = ProxySettings(enabled=True, base_url=BASE_URL, api_key="sk-or-test-key")
+
+        assert expected in get_proxy_status_line(settings)
@@ -1,20 +1,20 @@
 """Tests for SessionCommandBuilder, focusing on security validation."""
 
-import os
 import pytest
-from unittest.mock import patch
 
 from zen_portal.services.session_commands import SessionCommandBuilder
 from zen_portal.services.config import ProxySettings
 
 
+@pytest.fixture(scope="module")
+def builder():
+    """Shared builder: it holds no state, so one instance serves every test."""
+    return SessionCommandBuilder()
+
+
 class TestSessionCommandBuilderURLValidation:
     """Tests for URL validation in build_proxy_env_vars."""
 
-    @pytest.fixture
-    def builder(self):
-        return SessionCommandBuilder()
-
     def test_valid_http_url(self, builder):
         """Valid HTTP URL is accepted."""
         result = builder._validate_url("http://localhost:8787")
@@ -67,14 +67,20 @@ class TestSessionCommandBuilderURLValidation:
         assert result is not None
         assert "localhost" in result
 
+    def test_uppercase_scheme_normalized(self, builder):
+        """Scheme matching is case-insensitive and the result is lowercased."""
+        result = builder._validate_url("HTTPS://api.openrouter.ai/v1")
+        assert result == "https://api.openrouter.ai/v1"
+
+    def test_url_path_params_dropped(self, builder):
+        """;params on the last path segment are not carried into the URL."""
+        result = builder._validate_url("http://localhost:8787/v1;evil")
+        assert result == "http://localhost:8787/v1"
+
 
 class TestSessionCommandBuilderAPIKeyValidation:
     """Tests for API key validation."""
 
-    @pytest.fixture
-    def builder(self):
-        return SessionCommandBuilder()
-
     def test_valid_api_key_alphanumeric(self, builder):
         """Standard alphanumeric API keys are accepted."""
         result = builder._validate_api_key("sk-or-v1-abc123def456")
@@ -95,12 +101,12 @@ class TestSessionCommandBuilderAPIKeyValidation:
         result = builder._validate_api_key("  sk-or-key  ")
         assert result == "sk-or-key"
 
-    def test_api_key_with_shell_metacharacters(self, builder):
+    @pytest.mark.parametrize(
+        "key", ["key; rm -rf /", "key$(whoami)", "key`id`", "key | cat /etc/passwd"]
+    )
+    def test_api_key_with_shell_metacharacters(self, builder, key):
         """API keys with shell metacharacters are rejected."""
-        assert builder._validate_api_key("key; rm -rf /") is None
-        assert builder._validate_api_key("key$(whoami)") is None
-        assert builder._validate_api_key("key`id`") is None
-        assert builder._validate_api_key("key | cat /etc/passwd") is None
+        assert builder._validate_api_key(key) is None
 
     def test_api_key_with_newlines(self, builder):
         """API keys with newlines are rejected."""
@@ -122,10 +128,6 @@ class TestSessionCommandBuilderAPIKeyValidation:
 class TestSessionCommandBuilderModelValidation:
     """Tests for model name validation."""
 
-    @pytest.fixture
-    def builder(self):
-        return SessionCommandBuilder()
-
     def test_valid_model_anthropic(self, builder):
         """Anthropic model names are accepted."""
         result = builder._validate_model_name("anthropic/claude-sonnet-4")
@@ -146,11 +148,10 @@ class TestSessionCommandBuilderModelValidation:
         result = builder._validate_model_name("anthropic/claude-3.5-sonnet")
         assert result == "anthropic/claude-3.5-sonnet"
 
-    def test_model_with_shell_metacharacters(self, builder):
+    @pytest.mark.parametrize("model", ["model; rm -rf /", "$(whoami)", "model`id`"])
+    def test_model_with_shell_metacharacters(self, builder, model):
         """Model names with shell metacharacters are rejected."""
-        assert builder._validate_model_name("model; rm -rf /") is None
-        assert builder._validate_model_name("$(whoami)") is None
-        assert builder._validate_model_name("model`id`") is None
+        assert builder._validate_model_name(model) is None
 
     def test_model_with_spaces(self, builder):
         """Model names with spaces are rejected."""
@@ -172,10 +173,6 @@ class TestSessionCommandBuilderModelValidation:
 class TestBuildProxyEnvVars:
     """Tests for the build_proxy_env_vars method (y-router / OpenRouter)."""
 
-    @pytest.fixture
-    def builder(self):
-        return SessionCommandBuilder()
-
     def test_disabled_returns_empty(self, builder):
         """When proxy is disabled, returns empty dict."""
         settings = ProxySettings(enabled=False)
@@ -243,24 +240,24 @@ class TestBuildProxyEnvVars:
         result = builder.build_proxy_env_vars(settings)
         assert "ANTHROPIC_MODEL" not in result
 
-    def test_api_key_from_environment(self, builder):
+    def test_api_key_from_environment(self, builder, monkeypatch):
         """API key can be read from OPENROUTER_API_KEY environment variable."""
         settings = ProxySettings(
             enabled=True,
             api_key="",  # No key in settings
         )
-        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "sk-or-env-key"}):
-            result = builder.build_proxy_env_vars(settings)
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-env-key")
+        result = builder.build_proxy_env_vars(settings)
         assert result["ANTHROPIC_API_KEY"] == "sk-or-env-key"
 
-    def test_settings_api_key_overrides_env(self, builder):
+    def test_settings_api_key_overrides_env(self, builder, monkeypatch):
         """Settings API key takes precedence over environment variable."""
         settings = ProxySettings(
             enabled=True,
             api_key="sk-or-settings-key",
         )
-        with patch.dict(os.environ, {"OPENROUTER_API_KEY": "sk-or-env-key"}):
-            result = builder.build_proxy_env_vars(settings)
+        monkeypatch.setenv("OPENROUTER_API_KEY", "sk-or-env-key")
+        result = builder.build_proxy_env_vars(settings)
         assert result["ANTHROPIC_API_KEY"] == "sk-or-settings-key"
 
     def test_full_valid_config(self, builder):
@@ -291,10 +288,6 @@ class TestBuildProxyEnvVars:
 class TestBuildOpenRouterEnvVarsAlias:
     """Test backwards compatibility alias."""
 
-    @pytest.fixture
-    def builder(self):
-        return SessionCommandBuilder()
-
     def test_alias_calls_build_proxy_env_vars(self, builder):
         """build_openrouter_env_vars is an alias for build_proxy_env_vars."""
         settings = ProxySettings(
@@ -309,10 +302,6 @@ class TestBuildOpenRouterEnvVarsAlias:
 class TestWrapWithBannerLargeCommands:
     """Tests for wrap_with_banner handling large commands."""
 
-    @pytest.fixture
-    def builder(self):
-        return SessionCommandBuilder()
-
     def test_small_command_uses_inline_script(self, builder):
         """Small commands use inline zsh -l -i -c approach."""
         command = ["claude", "--dangerously-skip-permissions"]
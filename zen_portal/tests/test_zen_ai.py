@@ -3,6 +3,9 @@
 Tests context parsing, loading indicator, and prompt modal.
 """
 
+import io
+import json
+
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
 from pathlib import Path
@@ -14,6 +17,14 @@ from zen_portal.services.context_parser import (
     SessionContext,
 )
 from zen_portal.models.session import Session, SessionType, SessionState
+from zen_portal.services.config import (
+    ProxySettings,
+    ZenAIConfig,
+    ZenAIModel,
+    ZenAIProvider,
+)
+from zen_portal.services.openrouter.sse import iter_sse_events, read_stream
+from zen_portal.services.zen_ai import ZenAI, ZenAIResult
 
 
 class TestParseContextRefs:
@@ -259,3 +270,327 @@ class TestGatherContext:
         assert context.error_message == "binary not found"
 
 
+class TestClaudePipe:
+    """Test claude -p invocation."""
+
+    @pytest.fixture
+    def run(self):
+        completed = MagicMock(returncode=0, stdout=b"  answer\n", stderr=b"")
+        with patch("zen_portal.services.zen_ai.subprocess.run", return_value=completed) as run:
+            yield run
+
+    async def test_command_uses_model_tier(self, run):
+        """Model tier maps to the --model argument."""
+        zen_ai = ZenAI(ZenAIConfig(model=ZenAIModel.SONNET))
+        result = await zen_ai._query_claude_pipe("hi")
+
+        assert result.response == "answer"
+        assert run.call_args.args[0] == ["claude", "-p", "--model", "sonnet"]
+
+    async def test_env_inherited_without_proxy(self, run):
+        """Without a proxy the subprocess inherits the environment."""
+        zen_ai = ZenAI(ZenAIConfig())
+        await zen_ai._query_claude_pipe("hi")
+
+        assert run.call_args.kwargs["env"] is None
+
+    async def test_env_reused_across_queries(self, run):
+        """Proxy environment is built once, not per query."""
+        zen_ai = ZenAI(ZenAIConfig(), ProxySettings(enabled=True))
+        await zen_ai._query_claude_pipe("one")
+        await zen_ai._query_claude_pipe("two")
+
+        first, second = (c.kwargs["env"] for c in run.call_args_list)
+        assert first is second
+        assert first["ANTHROPIC_BASE_URL"] == "http://localhost:8787"
+
+    async def test_env_rebuilt_on_proxy_change(self, run):
+        """Assigning new proxy settings applies their overrides."""
+        zen_ai = ZenAI(ZenAIConfig())
+        await zen_ai._query_claude_pipe("one")
+        zen_ai.proxy_settings = ProxySettings(enabled=True, api_key="sk-or-test")
+        await zen_ai._query_claude_pipe("two")
+
+        env = run.call_args.kwargs["env"]
+        assert env["ANTHROPIC_BASE_URL"] == "http://localhost:8787"
+        assert env["ANTHROPIC_API_KEY"] == "sk-or-test"
+
+    async def test_oversize_output_truncated(self, run):
+        """Runaway output is cut to MAX_RESPONSE_LENGTH."""
+        run.return_value.stdout = b"x" * (ZenAI.MAX_RESPONSE_LENGTH * 5)
+        result = await ZenAI(ZenAIConfig())._query_claude_pipe("hi")
+
+        assert result.response == "x" * ZenAI.MAX_RESPONSE_LENGTH + "..."
+
+
+class TestTruncateOutput:
+    """Test bounding decoded subprocess output."""
+
+    def test_short_output_stripped(self):
+        """Output within the limit is only decoded and stripped."""
+        assert ZenAI(ZenAIConfig())._truncate_output(" héllo\n".encode()) == "héllo"
+
+    def test_long_output_truncated(self):
+        """Output just over the character limit is cut with an ellipsis."""
+        raw = b"x" * (ZenAI.MAX_RESPONSE_LENGTH + 1)
+        response = ZenAI(ZenAIConfig())._truncate_output(raw)
+
+        assert response == "x" * ZenAI.MAX_RESPONSE_LENGTH + "..."
+
+    def test_multibyte_character_split_at_byte_cut(self):
+        """A character split by the byte cut never reaches the response."""
+        raw = ("a" + "\U0001F600" * ZenAI.MAX_RESPONSE_LENGTH).encode("utf-8")
+        response = ZenAI(ZenAIConfig())._truncate_output(raw)
+
+        assert response == "a" + "\U0001F600" * (ZenAI.MAX_RESPONSE_LENGTH - 1) + "..."
+        assert "\ufffd" not in response
+
+    def test_split_character_dropped_after_leading_whitespace(self):
+        """Stripped leading whitespace doesn't let a split character through."""
+        raw = (" " * 5 + "\U0001F600" * ZenAI.MAX_RESPONSE_LENGTH).encode("utf-8")
+        response = ZenAI(ZenAIConfig())._truncate_output(raw)
+
+        assert response == "\U0001F600" * (ZenAI.MAX_RESPONSE_LENGTH - 2) + "..."
+        assert "\ufffd" not in response
+
+
+class TestBuildPayload:
+    """Test OpenRouter request body encoding."""
+
+    def test_payload_with_system_prompt(self):
+        """System message precedes the user message."""
+        zen_ai = ZenAI(ZenAIConfig(openrouter_model="openai/gpt-4o"))
+        payload = json.loads(zen_ai._build_payload("hi", 'say "hello"'))
+
+        assert payload["model"] == "openai/gpt-4o"
+        assert payload["messages"] == [
+            {"role": "system", "content": 'say "hello"'},
+            {"role": "user", "content": "hi"},
+        ]
+
+    def test_payload_without_system_prompt(self):
+        """Only the user message is sent without a system prompt."""
+        zen_ai = ZenAI(ZenAIConfig())
+        payload = json.loads(zen_ai._build_payload("hi"))
+
+        assert payload["messages"] == [{"role": "user", "content": "hi"}]
+
+    def test_payload_budget_matches_response_limit(self):
+        """max_tokens follows the character budget and streaming is on."""
+        payload = json.loads(ZenAI(ZenAIConfig())._build_payload("hi"))
+
+        assert payload["max_tokens"] == ZenAI.MAX_RESPONSE_LENGTH // 4
+        assert payload["stream"] is True
+
+
+class TestIterSSEEvents:
+    """Test server-sent event framing."""
+
+    def test_frames_split_across_reads(self):
+        """Events spanning read boundaries are reassembled."""
+        stream = io.BytesIO(b'data: {"a": 1}\n\n: comment\n\ndata: [DONE]\n\n')
+        events = list(iter_sse_events(stream, chunk_size=4))
+
+        assert events == [b'{"a": 1}', b"[DONE]"]
+
+    def test_multiline_data_joined(self):
+        """Multiple data lines in one event are joined with newlines."""
+        stream = io.BytesIO(b"data: one\ndata: two\n\n")
+        assert list(iter_sse_events(stream)) == [b"one\ntwo"]
+
+    def test_incomplete_trailing_event_dropped(self):
+        """An event without its terminating blank line is not yielded."""
+        stream = io.BytesIO(b"data: done\n\ndata: partial")
+        assert list(iter_sse_events(stream)) == [b"done"]
+
+    @pytest.mark.parametrize("chunk_size", [1, 16384])
+    @pytest.mark.parametrize("newline", [b"\r\n", b"\r"], ids=["crlf", "cr"])
+    def test_cr_line_endings(self, newline, chunk_size):
+        """CRLF and CR terminators frame events like LF, even split across reads."""
+        body = b"data: one%(n)sdata: two%(n)s%(n)s: ping%(n)s%(n)sdata: [DONE]%(n)s%(n)s"
+        stream = io.BytesIO(body % {b"n": newline})
+
+        assert list(iter_sse_events(stream, chunk_size=chunk_size)) == [b"one\ntwo", b"[DONE]"]
+
+
+class TestReadStream:
+    """Test collecting streamed OpenRouter responses."""
+
+    @staticmethod
+    def _sse(*events) -> io.BytesIO:
+        lines = [b": OPENROUTER PROCESSING\n\n"]
+        lines += [b"data: " + json.dumps(e).encode() + b"\n\n" for e in events]
+        lines.append(b"data: [DONE]\n\n")
+        return io.BytesIO(b"".join(lines))
+
+    @staticmethod
+    def _delta(text: str) -> dict:
+        return {"choices": [{"delta": {"content": text}}]}
+
+    def test_collects_deltas_and_usage(self):
+        """Content deltas are joined and usage is kept."""
+        resp = self._sse(
+            self._delta("hel"),
+            self._delta("lo"),
+            {"choices": [], "usage": {"total_tokens": 7}},
+        )
+        data = read_stream(resp, ZenAI.MAX_RESPONSE_LENGTH)
+
+        assert data["choices"][0]["message"]["content"] == "hello"
+        assert data["usage"]["total_tokens"] == 7
+
+    def test_stops_at_response_limit(self):
+        """Reading stops once the character budget is exceeded."""
+        chunk = "x" * 6000
+        resp = self._sse(self._delta(chunk), self._delta(chunk), self._delta(chunk))
+        data = read_stream(resp, ZenAI.MAX_RESPONSE_LENGTH)
+
+        assert data["choices"][0]["message"]["content"] == chunk * 2
+
+    def test_error_event(self):
+        """Mid-stream error is returned as an error payload."""
+        resp = self._sse({"error": {"message": "rate limited"}})
+        data = read_stream(resp, ZenAI.MAX_RESPONSE_LENGTH)
+
+        assert data == {"error": {"message": "rate limited"}}
+
+
+class TestQueryBatch:
+    """Test batching several prompts into one query."""
+
+    @pytest.fixture
+    def zen_ai(self):
+        config = ZenAIConfig(enabled=True, provider=ZenAIProvider.OPENROUTER, model=ZenAIModel.SONNET)
+        return ZenAI(config, ProxySettings(api_key="sk-or-test"))
+
+    async def test_empty_batch(self, zen_ai):
+        """No prompts returns no results."""
+        assert await zen_ai.query_batch([]) == []
+
+    async def test_batch_single_request(self, zen_ai):
+        """Multiple prompts are answered by one API call."""
+        api = AsyncMock(return_value=ZenAIResult(
+            success=True, response='["one", "two"]', tokens_used=10,
+        ))
+        with patch.object(zen_ai, "_query_openrouter_api", api):
+            results = await zen_ai.query_batch(["q1", "q2"], "context")
+
+        api.assert_called_once()
+        prompt, system = api.call_args.args
+        assert prompt == '["q1", "q2"]'
+        assert system.startswith("context")
+        assert [r.response for r in results] == ["one", "two"]
+        assert all(r.success and r.tokens_used == 5 for r in results)
+        assert api.call_args.kwargs["max_length"] == ZenAI.MAX_RESPONSE_LENGTH * 2
+
+    @staticmethod
+    def _streamed(text: str) -> MagicMock:
+        body = b"data: " + json.dumps({"choices": [{"delta": {"content": text}}]}).encode()
+        resp = MagicMock()
+        resp.__enter__.return_value = io.BytesIO(body + b"\n\ndata: [DONE]\n\n")
+        return resp
+
+    async def test_batch_budget_scales_with_prompts(self, zen_ai):
+        """A reply longer than one query's budget still fits a batch."""
+        answer = "x" * (ZenAI.MAX_RESPONSE_LENGTH - 100)
+        reply = json.dumps([answer] * 3)
+        with patch("zen_portal.services.zen_ai.urlopen", return_value=self._streamed(reply)) as urlopen:
+            results = await zen_ai.query_batch(["q1", "q2", "q3"])
+
+        urlopen.assert_called_once()
+        payload = json.loads(urlopen.call_args.args[0].data)
+        assert payload["max_tokens"] == ZenAI.MAX_RESPONSE_LENGTH * 3 // 4
+        assert [r.response for r in results] == [answer] * 3
+
+    async def test_batch_truncated_reply_falls_back(self, zen_ai):
+        """A reply cut at the batch budget is re-queried per prompt."""
+        reply = json.dumps(["x" * ZenAI.MAX_RESPONSE_LENGTH] * 3)
+        responses = [self._streamed(reply), self._streamed("one"), self._streamed("two")]
+        with patch("zen_portal.services.zen_ai.urlopen", side_effect=responses) as urlopen:
+            results = await zen_ai.query_batch(["q1", "q2"])
+
+        assert urlopen.call_count == 3
+        assert sorted(r.response for r in results) == ["one", "two"]
+
+    async def test_batch_falls_back_on_bad_reply(self, zen_ai):
+        """Unsplittable reply falls back to one query per prompt."""
+        batch = ZenAIResult(success=True, response="not json")
+        single = ZenAIResult(success=True, response="answer")
+        api = AsyncMock(side_effect=[batch, single, single])
+        with patch.object(zen_ai, "_query_openrouter_api", api):
+            results = await zen_ai.query_batch(["q1", "q2"])
+
+        assert api.call_count == 3
+        assert [r.response for r in results] == ["answer", "answer"]
+
+    async def test_batch_failure_falls_back(self, zen_ai):
+        """A failed batch request is retried one prompt at a time."""
+        batch = ZenAIResult(success=False, response="", error="api error: 400")
+        single = ZenAIResult(success=True, response="answer")
+        api = AsyncMock(side_effect=[batch, single, single])
+        with patch.object(zen_ai, "_query_openrouter_api", api):
+            results = await zen_ai.query_batch(["q1", "q2"])
+
+        assert api.call_count == 3
+        assert [r.response for r in results] == ["answer", "answer"]
+        assert all(r.success for r in results)
+
+    async def test_batch_split_within_output_limit(self, zen_ai):
+        """Prompts are grouped so no request exceeds the model's token limit."""
+        zen_ai.config.model = ZenAIModel.OPUS
+        size = 32000 // ZenAI.MAX_TOKENS
+        prompts = [f"q{i}" for i in range(size + 1)]
+
+        async def api(prompt, system, max_length):
+            count = len(json.loads(prompt))
+            assert max_length // 4 <= 32000
+            return ZenAIResult(success=True, response=json.dumps(["a"] * count))
+
+        single = AsyncMock(return_value=ZenAIResult(success=True, response="b"))
+        with patch.object(zen_ai, "_query_openrouter_api", side_effect=api) as batch, \
+                patch.object(zen_ai, "query", single):
+            results = await zen_ai.query_batch(prompts)
+
+        batch.assert_called_once()
+        single.assert_called_once_with(prompts[-1], "")
+        assert [r.response for r in results] == ["a"] * size + ["b"]
+
+    async def test_small_output_limit_skips_batching(self, zen_ai):
+        """Models that can't fit two full answers query each prompt alone."""
+        zen_ai.config.model = ZenAIModel.HAIKU
+        api = AsyncMock(return_value=ZenAIResult(success=True, response="answer"))
+        with patch.object(zen_ai, "_query_openrouter_api", api):
+            results = await zen_ai.query_batch(["q1", "q2"])
+
+        assert [c.args for c in api.call_args_list] == [("q1", ""), ("q2", "")]
+        assert [r.response for r in results] == ["answer", "answer"]
+
+
+class TestStreamQuery:
+    """Test simulated streaming."""
+
+    async def test_stream_yields_chunks_without_delay(self):
+        """Default config streams chunks with no fixed sleep."""
+        zen_ai = ZenAI(ZenAIConfig())
+        result = ZenAIResult(success=True, response="a" * 120)
+        sleep = AsyncMock()
+        with patch.object(zen_ai, "query", AsyncMock(return_value=result)), \
+                patch("zen_portal.services.zen_ai.asyncio.sleep", sleep):
+            chunks = [chunk async for chunk in zen_ai.stream_query("hi")]
+
+        assert "".join(chunks) == result.response
+        assert len(chunks) == 3
+        assert all(c.args == (0.0,) for c in sleep.call_args_list)
+
+    def test_stream_delay_round_trip(self):
+        """Non-default stream delay survives serialization."""
+        config = ZenAIConfig(stream_delay=0.02)
+        assert ZenAIConfig.from_dict(config.to_dict()).stream_delay == 0.02
+        assert "stream_delay" not in ZenAIConfig().to_dict()
+
+    @pytest.mark.parametrize(("raw", "expected"), [("0.5", 0.5), ("fast", 0.0), ([1], 0.0)])
+    def test_stream_delay_coerced_from_config(self, raw, expected):
+        """Hand-edited stream delays are coerced to float or ignored."""
+        config = ZenAIConfig.from_dict({"stream_delay": raw})
+        assert config.stream_delay == expected
+        config.to_dict()  # Must not raise on comparison